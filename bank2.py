@@ -5,10 +5,26 @@ Banker's Algorithm program with:
 3) Generate ALL safe sequences (backtracking)
 4) Resource release (on process completion)
 Menu-driven and accepts user input for matrices.
+
+With command-line arguments it runs in batch mode instead, e.g.
+  python bank2.py --state state.json --op safety
+  python bank2.py --max max.npy --alloc alloc.npy --available avail.csv --op safety --output out.json
+  python bank2.py --state state.npz --op requests --script requests.csv --policy fifo
 """
 
+from concurrent.futures import ProcessPoolExecutor
 from typing import List, Tuple
+import argparse
+import heapq
+import json
+import random
 import sys
+import time
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the list-based engine always works
+    np = None
 
 def input_matrix(rows: int, cols: int, name: str) -> List[List[int]]:
     print(f"\nEnter {name} matrix ({rows} rows, {cols} cols).")
@@ -84,17 +100,181 @@ def safety_check(maxm: List[List[int]], alloc: List[List[int]], available: List[
             return False, []
     return True, safe_seq
 
-def find_all_safe_sequences(maxm: List[List[int]], alloc: List[List[int]], available: List[int]) -> List[List[int]]:
+def safety_check_np(maxm: List[List[int]], alloc: List[List[int]], available: List[int]) -> Tuple[bool, List[int]]:
+    """
+    NumPy version of safety_check with the same (is_safe, safe_sequence) contract.
+    Need is computed once as an (n, m) matrix; each pass finds every runnable
+    process with one vectorized comparison and finishes all of them (in index order).
+    The sequence returned is valid but may differ from the one safety_check picks.
+    """
+    if np is None:
+        raise RuntimeError("The 'numpy' safety engine requires NumPy to be installed.")
+    alloc_a = np.asarray(alloc, dtype=np.int64)
+    need = np.asarray(maxm, dtype=np.int64) - alloc_a
+    work = np.array(available, dtype=np.int64)
+    n = need.shape[0]
+    pending = np.arange(n)
+    safe_seq = []
+
+    while pending.size:
+        runnable = np.all(need[pending] <= work, axis=1)
+        if not runnable.any():
+            return False, []
+        ready = pending[runnable]
+        work += alloc_a[ready].sum(axis=0)
+        safe_seq.extend(ready.tolist())
+        pending = pending[~runnable]
+    return True, safe_seq
+
+def safety_check_sorted(maxm: List[List[int]], alloc: List[List[int]], available: List[int]) -> Tuple[bool, List[int]]:
+    """
+    Safety check without the "rescan until nothing progresses" loop.
+    For each resource type the processes are kept sorted by their Need for it, and a
+    pointer per resource walks that order as work grows. A process becomes runnable
+    once all m pointers have passed it. Total cost is O(n*m*log n).
+    Same (is_safe, safe_sequence) contract as safety_check; ready processes are
+    finished lowest index first.
+    """
+    n = len(maxm)
+    m = len(available)
+    need = compute_need(maxm, alloc)
+    work = available.copy()
+    order = [sorted(range(n), key=lambda i, j=j: need[i][j]) for j in range(m)]
+    ptr = [0]*m
+    satisfied = [0]*n  # number of resource types where need[i][j] <= work[j]
+    ready = []
+    safe_seq = []
+
+    if m == 0:
+        ready = list(range(n))
+
+    def advance(j):
+        col = order[j]
+        k = ptr[j]
+        while k < n and need[col[k]][j] <= work[j]:
+            i = col[k]
+            satisfied[i] += 1
+            if satisfied[i] == m:
+                heapq.heappush(ready, i)
+            k += 1
+        ptr[j] = k
+
+    for j in range(m):
+        advance(j)
+
+    while ready:
+        i = heapq.heappop(ready)
+        safe_seq.append(i)
+        for j in range(m):
+            if alloc[i][j]:
+                work[j] += alloc[i][j]
+                advance(j)
+
+    if len(safe_seq) < n:
+        return False, []
+    return True, safe_seq
+
+SAFETY_ENGINES = {
+    "list": safety_check,
+    "numpy": safety_check_np,
+    "sorted": safety_check_sorted,
+}
+
+def get_safety_engine(name: str):
+    """Look up a safety engine by name (see SAFETY_ENGINES)."""
+    try:
+        return SAFETY_ENGINES[name]
+    except KeyError:
+        raise ValueError(f"Unknown safety engine {name!r}; choose from {sorted(SAFETY_ENGINES)}.")
+
+def is_valid_safe_sequence(maxm: List[List[int]], alloc: List[List[int]], available: List[int], seq: List[int]) -> bool:
+    """Return True if seq is a permutation of all processes that can run to completion in order."""
+    n = len(maxm)
+    if sorted(seq) != list(range(n)):
+        return False
+    need = compute_need(maxm, alloc)
+    work = available.copy()
+    for i in seq:
+        if not is_less_or_equal(need[i], work):
+            return False
+        work = add_vec(work, alloc[i])
+    return True
+
+def random_state(n: int, m: int, rng: random.Random, max_claim: int = 10) -> Tuple[List[List[int]], List[List[int]], List[int]]:
+    """Generate a random (maxm, alloc, available) state with Allocation <= Max."""
+    maxm = [[rng.randint(0, max_claim) for _ in range(m)] for _ in range(n)]
+    alloc = [[rng.randint(0, x) for x in row] for row in maxm]
+    available = [rng.randint(0, max_claim) for _ in range(m)]
+    return maxm, alloc, available
+
+def cross_check_engines(trials: int = 1000, n: int = 8, m: int = 3, seed: int = 0, engines: List[str] = None) -> List[Tuple[List[List[int]], List[List[int]], List[int]]]:
+    """
+    Run every engine on random states and verify that they agree on safety and
+    that each returned sequence is a valid safe sequence.
+    Returns the list of states on which a check failed (empty when all agree).
+    Engines whose dependencies are missing (e.g. NumPy) are skipped.
+    """
+    if engines is None:
+        engines = [name for name in SAFETY_ENGINES if name != "numpy" or np is not None]
+    checks = [get_safety_engine(name) for name in engines]
+    rng = random.Random(seed)
+    failures = []
+    for _ in range(trials):
+        state = random_state(rng.randint(1, n), m, rng)
+        results = [check(*state) for check in checks]
+        verdicts = {safe for safe, _ in results}
+        if len(verdicts) != 1 or any(safe and not is_valid_safe_sequence(*state, seq) for safe, seq in results):
+            failures.append(state)
+    return failures
+
+def find_all_safe_sequences(maxm: List[List[int]], alloc: List[List[int]], available: List[int], workers: int = 1, split_depth: int = 1) -> List[List[int]]:
     """
     Return list of all safe sequences (each sequence is a list of process indices).
     Uses recursion/backtracking.
+    With workers > 1 the search tree is split by its first split_depth choices and
+    each subtree is searched in a ProcessPoolExecutor worker. Results are merged in
+    prefix order, so the output is identical to the serial search.
     """
+    if workers <= 1:
+        return _safe_sequences_with_prefix(maxm, alloc, available, [])
+    prefixes = _safe_prefixes(maxm, alloc, available, split_depth)
+    all_seq = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        jobs = [pool.submit(_safe_sequences_with_prefix, maxm, alloc, available, p) for p in prefixes]
+        for job in jobs:
+            all_seq.extend(job.result())
+    return all_seq
+
+def _safe_prefixes(maxm: List[List[int]], alloc: List[List[int]], available: List[int], depth: int) -> List[List[int]]:
+    """Return every runnable prefix of length depth (or shorter, if it already covers all processes)."""
+    n = len(maxm)
+    need = compute_need(maxm, alloc)
+    prefixes = []
+
+    def walk(work, prefix):
+        if len(prefix) == min(depth, n):
+            prefixes.append(prefix.copy())
+            return
+        for i in range(n):
+            if i not in prefix and is_less_or_equal(need[i], work):
+                prefix.append(i)
+                walk(add_vec(work, alloc[i]), prefix)
+                prefix.pop()
+
+    walk(available.copy(), [])
+    return prefixes
+
+def _safe_sequences_with_prefix(maxm: List[List[int]], alloc: List[List[int]], available: List[int], prefix: List[int]) -> List[List[int]]:
+    """Backtracking search for all safe sequences that start with the (runnable) prefix."""
     n = len(maxm)
     need = compute_need(maxm, alloc)
     work = available.copy()
     finish = [False]*n
+    for i in prefix:
+        work = add_vec(work, alloc[i])
+        finish[i] = True
     all_seq = []
-    seq = []
+    seq = list(prefix)
 
     def backtrack(work, finish, seq):
         if len(seq) == n:
@@ -117,11 +297,119 @@ def find_all_safe_sequences(maxm: List[List[int]], alloc: List[List[int]], avail
     backtrack(work, finish, seq)
     return all_seq
 
-def request_resources(maxm: List[List[int]], alloc: List[List[int]], available: List[int], pid: int, req: List[int]) -> Tuple[bool, str]:
+# The menu prints at most this many sequences; the rest are only counted.
+MAX_PRINTED_SEQUENCES = 50
+
+def _safe_sequence_counter(maxm: List[List[int]], alloc: List[List[int]], available: List[int]):
+    """
+    Build count(mask, work) -> number of safe completions once the processes in the
+    bitmask mask have finished. work depends only on mask, so results are memoized
+    per subset and dead subsets are pruned once.
+    """
+    n = len(maxm)
+    need = compute_need(maxm, alloc)
+    full = (1 << n) - 1
+    memo = {full: 1}
+
+    def count(mask: int, work: List[int]) -> int:
+        if mask in memo:
+            return memo[mask]
+        # explicit stack of [mask, work, next candidate index, partial total]
+        stack = [[mask, work, 0, 0]]
+        while stack:
+            frame = stack[-1]
+            cur, cur_work, i, total = frame
+            while i < n:
+                if not cur & (1 << i) and is_less_or_equal(need[i], cur_work):
+                    child = cur | (1 << i)
+                    if child not in memo:
+                        frame[2], frame[3] = i + 1, total
+                        stack.append([child, add_vec(cur_work, alloc[i]), 0, 0])
+                        break
+                    total += memo[child]
+                i += 1
+            else:
+                memo[cur] = total
+                stack.pop()
+                if stack:
+                    stack[-1][3] += total
+        return memo[mask]
+
+    return count, need
+
+def count_safe_sequences(maxm: List[List[int]], alloc: List[List[int]], available: List[int], workers: int = 1, split_depth: int = 1) -> int:
+    """
+    Return the number of safe sequences without materializing them (subset DP).
+    With workers > 1 the count is split by the same prefixes as
+    find_all_safe_sequences; each worker returns one integer and the parent sums
+    them. Memo tables are per worker, so subsets reachable from several prefixes
+    are counted once in each.
+    """
+    if workers <= 1:
+        count, _ = _safe_sequence_counter(maxm, alloc, available)
+        return count(0, available.copy())
+    prefixes = _safe_prefixes(maxm, alloc, available, split_depth)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        jobs = [pool.submit(_count_with_prefix, maxm, alloc, available, p) for p in prefixes]
+        return sum(job.result() for job in jobs)
+
+def _count_with_prefix(maxm: List[List[int]], alloc: List[List[int]], available: List[int], prefix: List[int]) -> int:
+    """Number of safe sequences that start with the (runnable) prefix."""
+    count, _ = _safe_sequence_counter(maxm, alloc, available)
+    mask = 0
+    work = available.copy()
+    for i in prefix:
+        mask |= 1 << i
+        work = add_vec(work, alloc[i])
+    return count(mask, work)
+
+def iter_safe_sequences(maxm: List[List[int]], alloc: List[List[int]], available: List[int], limit: int = None):
+    """
+    Lazily yield safe sequences in the same order as find_all_safe_sequences,
+    stopping after limit sequences if given. Subtrees with no safe completion
+    are skipped using the memoized subset counts.
+    """
+    n = len(maxm)
+    count, need = _safe_sequence_counter(maxm, alloc, available)
+    if limit is not None and limit <= 0:
+        return
+    if count(0, available.copy()) == 0:
+        return
+    seq = []
+    # explicit stack of (mask, work, next candidate index) so deep trees do not recurse
+    stack = [(0, available.copy(), 0)]
+    emitted = 0
+    while stack:
+        mask, work, start = stack.pop()
+        if len(seq) == n:
+            yield seq.copy()
+            emitted += 1
+            if limit is not None and emitted >= limit:
+                return
+            if seq:
+                seq.pop()
+            continue
+        for i in range(start, n):
+            if mask & (1 << i) or not is_less_or_equal(need[i], work):
+                continue
+            new_work = add_vec(work, alloc[i])
+            if count(mask | (1 << i), new_work) == 0:
+                continue
+            stack.append((mask, work, i + 1))
+            stack.append((mask | (1 << i), new_work, 0))
+            seq.append(i)
+            break
+        else:
+            if seq:
+                seq.pop()
+
+def request_resources(maxm: List[List[int]], alloc: List[List[int]], available: List[int], pid: int, req: List[int], engine: str = "list") -> Tuple[bool, str]:
     """
     Attempt to grant request req for process pid using Banker's Request Algorithm.
+    engine selects the safety check used (see SAFETY_ENGINES).
     Returns (granted_bool, message).
     """
+    check = get_safety_engine(engine)
     n = len(maxm)
     if pid < 0 or pid >= n:
         return False, "Invalid process id."
@@ -137,19 +425,21 @@ def request_resources(maxm: List[List[int]], alloc: List[List[int]], available:
     alloc_after = [row.copy() for row in alloc]
     alloc_after[pid] = add_vec(alloc_after[pid], req)
     # 4. Check safety
-    safe, seq = safety_check(maxm, alloc_after, available_after)
+    safe, seq = check(maxm, alloc_after, available_after)
     if safe:
         # commit changes to original structures (caller should update them if granted)
         return True, f"Request can be safely granted. Safe sequence after allocation: {['P'+str(x) for x in seq]}"
     else:
         return False, "Granting request would lead to unsafe state. Request denied."
 
-def release_process(maxm: List[List[int]], alloc: List[List[int]], available: List[int], pid: int) -> Tuple[bool, str]:
+def release_process(maxm: List[List[int]], alloc: List[List[int]], available: List[int], pid: int, engine: str = "list") -> Tuple[bool, str]:
     """
     Simulate process pid completion: release its allocated resources back to available,
     zero its allocation and update need (need will be max - alloc).
+    engine selects the safety check used (see SAFETY_ENGINES).
     Returns (True, message) on success.
     """
+    check = get_safety_engine(engine)
     n = len(maxm)
     if pid < 0 or pid >= n:
         return False, "Invalid process id."
@@ -157,7 +447,7 @@ def release_process(maxm: List[List[int]], alloc: List[List[int]], available: Li
     available[:] = add_vec(available, alloc[pid])
     alloc[pid] = [0]*len(available)
     # need will be recomputed by caller using compute_need
-    safe, seq = safety_check(maxm, alloc, available)
+    safe, seq = check(maxm, alloc, available)
     if safe:
         return True, f"Released resources from P{pid}. System remains safe. Example safe seq: {['P'+str(x) for x in seq]}"
     else:
@@ -165,6 +455,166 @@ def release_process(maxm: List[List[int]], alloc: List[List[int]], available: Li
         # but if you want to model "process removed from system", it's safe.
         return True, f"Released resources from P{pid}. Safety check returned UNSAFE (check inputs)."
 
+class BankerState:
+    """
+    Banker's Algorithm state that owns Max, Allocation, Need and Available.
+    Need is updated in place on request and release (no matrix rebuilds or copies),
+    and the last safe sequence is cached. A new request is re-verified by replaying
+    the cached sequence; only if the replay gets stuck does the standard safety loop
+    continue from where it stopped.
+    """
+
+    def __init__(self, maxm: List[List[int]], alloc: List[List[int]], available: List[int]):
+        validate_state(maxm, alloc, available)
+        self.n = len(maxm)
+        self.m = len(available)
+        self.maxm = [row.copy() for row in maxm]
+        self.alloc = [row.copy() for row in alloc]
+        self.available = available.copy()
+        self.need = compute_need(self.maxm, self.alloc)
+        self.safe_seq: List[int] = []
+        self.replays = 0      # requests verified by replaying the cached sequence alone
+        self.full_checks = 0  # requests that needed the safety loop after the replay
+        self.safe, self.safe_seq = self._verify()
+
+    def _verify(self) -> Tuple[bool, List[int]]:
+        """Replay the cached safe sequence, then fall back to the safety loop for the rest."""
+        n = self.n
+        need, alloc = self.need, self.alloc
+        work = self.available.copy()
+        finish = [False]*n
+        seq = []
+        for i in self.safe_seq:
+            if not is_less_or_equal(need[i], work):
+                break
+            for j, a in enumerate(alloc[i]):
+                work[j] += a
+            finish[i] = True
+            seq.append(i)
+        if len(seq) == n:
+            self.replays += 1
+            return True, seq
+
+        self.full_checks += 1
+        # Finishing a runnable process never hurts, so the replayed prefix is kept.
+        while len(seq) < n:
+            progressed = False
+            for i in range(n):
+                if not finish[i] and is_less_or_equal(need[i], work):
+                    for j, a in enumerate(alloc[i]):
+                        work[j] += a
+                    finish[i] = True
+                    seq.append(i)
+                    progressed = True
+            if not progressed:
+                return False, []
+        return True, seq
+
+    def is_safe(self) -> Tuple[bool, List[int]]:
+        """Return (is_safe, safe_sequence) for the current state."""
+        return self.safe, self.safe_seq.copy()
+
+    def request(self, pid: int, req: List[int]) -> Tuple[bool, str]:
+        """
+        Banker's Request Algorithm. On success the allocation is committed;
+        otherwise the state is left unchanged. Returns (granted_bool, message).
+        """
+        if pid < 0 or pid >= self.n:
+            return False, "Invalid process id."
+        if len(req) != self.m:
+            return False, f"Request must have {self.m} entries, got {len(req)}. Denied."
+        if any(r < 0 for r in req):
+            return False, "Request entries must be non-negative. Denied."
+        if not is_less_or_equal(req, self.need[pid]):
+            return False, f"Process P{pid} has request greater than its need. Denied."
+        if not is_less_or_equal(req, self.available):
+            return False, f"Resources not available now; process must wait (request > available)."
+        self._apply(pid, req, 1)
+        safe, seq = self._verify()
+        if not safe:
+            self._apply(pid, req, -1)
+            return False, "Granting request would lead to unsafe state. Request denied."
+        self.safe, self.safe_seq = True, seq
+        return True, f"Request can be safely granted. Safe sequence after allocation: {['P'+str(x) for x in seq]}"
+
+    def _apply(self, pid: int, req: List[int], sign: int):
+        avail, alloc_row, need_row = self.available, self.alloc[pid], self.need[pid]
+        for j, r in enumerate(req):
+            d = sign*r
+            avail[j] -= d
+            alloc_row[j] += d
+            need_row[j] -= d
+
+    def request_batch(self, requests: List[Tuple[int, List[int]]], policy: str = "fifo") -> Tuple[List[Tuple[int, bool, str]], dict]:
+        """
+        Admit a burst of (pid, request_vector) pairs against this state.
+        policy "fifo" decides them in arrival order; "max_granted" decides them in order
+        of increasing total request size. That is a heuristic for granting many
+        requests, not a guaranteed maximum. Granted requests are committed. Cheap
+        rejections never reach the safety check, and the rest share the cached safe
+        sequence between checks.
+        Returns (verdicts, stats): verdicts are (pid, granted, message) in input order.
+        In stats every verification counts as a safety check (each one walks up to n
+        processes); "replays" were settled by the cached sequence alone and
+        "full_rescans" needed the scan-until-no-progress loop after it.
+        """
+        if policy == "fifo":
+            order = list(range(len(requests)))
+        elif policy == "max_granted":
+            order = sorted(range(len(requests)), key=lambda k: sum(requests[k][1]))
+        else:
+            raise ValueError(f"Unknown batch policy {policy!r}; choose 'fifo' or 'max_granted'.")
+        replays, full_checks = self.replays, self.full_checks
+        verdicts = [None]*len(requests)
+        start = time.perf_counter()
+        for k in order:
+            pid, req = requests[k]
+            granted, msg = self.request(pid, req)
+            verdicts[k] = (pid, granted, msg)
+        elapsed = time.perf_counter() - start
+        replays = self.replays - replays
+        full_checks = self.full_checks - full_checks
+        stats = {
+            "requests": len(requests),
+            "granted": sum(1 for v in verdicts if v[1]),
+            "safety_checks": replays + full_checks,
+            "checks_avoided": len(requests) - replays - full_checks,
+            "replays": replays,
+            "full_rescans": full_checks,
+            "seconds": elapsed,
+            "requests_per_sec": len(requests) / elapsed if elapsed > 0 else float("inf"),
+        }
+        return verdicts, stats
+
+    def release(self, pid: int) -> Tuple[bool, str]:
+        """
+        Simulate process pid completion: return its allocation to Available and reset
+        its Need to its Max claim. Returns (True, message) on success.
+        """
+        if pid < 0 or pid >= self.n:
+            return False, "Invalid process id."
+        alloc_row = self.alloc[pid]
+        for j, a in enumerate(alloc_row):
+            self.available[j] += a
+            alloc_row[j] = 0
+        self.need[pid][:] = self.maxm[pid]
+        # A release can only grow work at every step, so a cached safe sequence stays valid.
+        if not self.safe:
+            self.safe, self.safe_seq = self._verify()
+        if self.safe:
+            return True, f"Released resources from P{pid}. System remains safe. Example safe seq: {['P'+str(x) for x in self.safe_seq]}"
+        return True, f"Released resources from P{pid}. Safety check returned UNSAFE (check inputs)."
+
+def request_batch(maxm: List[List[int]], alloc: List[List[int]], available: List[int], requests: List[Tuple[int, List[int]]], policy: str = "fifo") -> Tuple[List[Tuple[int, bool, str]], BankerState, dict]:
+    """
+    Batch version of request_resources. The input matrices are not modified; the
+    final committed state is returned as a BankerState.
+    Returns (verdicts, state, stats); see BankerState.request_batch.
+    """
+    state = BankerState(maxm, alloc, available)
+    verdicts, stats = state.request_batch(requests, policy)
+    return verdicts, state, stats
+
 def print_state(maxm: List[List[int]], alloc: List[List[int]], available: List[int]):
     n = len(maxm)
     m = len(available) if n>0 else 0
@@ -187,6 +637,183 @@ def parse_int_list(s: str, expected_len: int = None) -> List[int]:
         raise ValueError(f"Expected {expected_len} integers, got {len(vec)}.")
     return vec
 
+# -------------------------------------------
+# Non-interactive (batch) mode
+# -------------------------------------------
+STATE_KEYS = ("max", "allocation", "available")
+
+def _load_array(path: str):
+    """
+    Load one matrix or vector. .npy files are memory-mapped (never copied into
+    Python lists); CSV/whitespace text files become lists of ints.
+    """
+    if path.endswith(".npy"):
+        if np is None:
+            raise RuntimeError("Loading .npy files requires NumPy to be installed.")
+        return np.load(path, mmap_mode="r")
+    rows = []
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                rows.append(parse_int_list(line.replace(",", " ")))
+    return rows
+
+def load_state(path: str = None, max_path: str = None, alloc_path: str = None, available_path: str = None):
+    """
+    Load (maxm, alloc, available) either from one JSON/.npz file with keys
+    "max", "allocation" and "available", or from three separate CSV/.npy files.
+    NumPy inputs are returned as arrays; everything else as lists.
+    """
+    if path is not None:
+        if path.endswith(".npz"):
+            if np is None:
+                raise RuntimeError("Loading .npz files requires NumPy to be installed.")
+            data = np.load(path)
+        else:
+            with open(path) as f:
+                data = json.load(f)
+        try:
+            maxm, alloc, available = (data[k] for k in STATE_KEYS)
+        except KeyError as e:
+            raise ValueError(f"State file is missing key {e}.")
+    else:
+        if None in (max_path, alloc_path, available_path):
+            raise ValueError("Give either a state file or all of Max, Allocation and Available.")
+        maxm, alloc, available = _load_array(max_path), _load_array(alloc_path), _load_array(available_path)
+    if np is not None and isinstance(available, np.ndarray):
+        available = available.reshape(-1)
+    elif available and isinstance(available[0], list):
+        # a CSV vector may be written as one row or as one value per line
+        available = [x for row in available for x in row]
+    validate_state(maxm, alloc, available)
+    return maxm, alloc, available
+
+def validate_state(maxm, alloc, available):
+    """Check shapes and Allocation <= Max (same rule as the interactive main). Raises ValueError."""
+    if np is not None and (isinstance(maxm, np.ndarray) or isinstance(alloc, np.ndarray)):
+        maxm_a, alloc_a = np.asarray(maxm), np.asarray(alloc)
+        if maxm_a.ndim != 2 or maxm_a.shape != alloc_a.shape or maxm_a.shape[1] != len(available):
+            raise ValueError(f"Shape mismatch: Max {maxm_a.shape}, Allocation {alloc_a.shape}, Available ({len(available)},).")
+        bad = np.argwhere(alloc_a > maxm_a)
+        if bad.size:
+            i, j = bad[0]
+            raise ValueError(f"Allocation[{i}][{j}] > Max[{i}][{j}].")
+        return
+    m = len(available)
+    if len(maxm) != len(alloc) or any(len(row) != m for row in maxm) or any(len(row) != m for row in alloc):
+        raise ValueError(f"Max and Allocation must both be {len(maxm)}x{m}.")
+    for i in range(len(maxm)):
+        for j in range(m):
+            if alloc[i][j] > maxm[i][j]:
+                raise ValueError(f"Allocation[{i}][{j}] > Max[{i}][{j}].")
+
+def state_as_lists(maxm, alloc, available):
+    """Convert a (possibly NumPy-backed) state to plain lists of ints."""
+    if np is not None and isinstance(maxm, np.ndarray):
+        maxm = maxm.tolist()
+    if np is not None and isinstance(alloc, np.ndarray):
+        alloc = alloc.tolist()
+    if np is not None and isinstance(available, np.ndarray):
+        available = available.tolist()
+    return maxm, alloc, [int(x) for x in available]
+
+def load_request_script(path: str, m: int = None) -> List[Tuple[int, List[int]]]:
+    """
+    Load (pid, request_vector) pairs from JSON ([{"pid": 0, "req": [...]}, ...])
+    or CSV (one "pid,r0,r1,..." per line). With m given, every vector must have
+    m non-negative entries. Raises ValueError otherwise.
+    """
+    if path.endswith(".json"):
+        with open(path) as f:
+            try:
+                requests = [(int(r["pid"]), [int(x) for x in r["req"]]) for r in json.load(f)]
+            except (KeyError, TypeError) as e:
+                raise ValueError(f"Bad request entry: {e}")
+    else:
+        requests = []
+        with open(path) as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    row = parse_int_list(line.replace(",", " "))
+                    requests.append((row[0], row[1:]))
+    for k, (pid, req) in enumerate(requests, 1):
+        if m is not None and len(req) != m:
+            raise ValueError(f"Request {k} (P{pid}) has {len(req)} entries; expected {m}.")
+        if any(x < 0 for x in req):
+            raise ValueError(f"Request {k} (P{pid}) has a negative entry.")
+    return requests
+
+def run_batch(argv: List[str] = None) -> dict:
+    """
+    Command-line batch mode: load a state, run one operation, write JSON results.
+    Only --op safety with the numpy engine works on the memory-mapped .npy/.npz
+    arrays directly. The enumerate and requests operations (and the list/sorted
+    engines) run on Python lists, so for them the state is copied into memory.
+    """
+    parser = argparse.ArgumentParser(description="Banker's Algorithm in batch mode")
+    parser.add_argument("--state", help="JSON or .npz file with max, allocation and available")
+    parser.add_argument("--max", dest="max_path", help="Max matrix (CSV or .npy)")
+    parser.add_argument("--alloc", dest="alloc_path", help="Allocation matrix (CSV or .npy)")
+    parser.add_argument("--available", dest="available_path", help="Available vector (CSV or .npy)")
+    parser.add_argument("--op", choices=["safety", "enumerate", "requests"], default="safety")
+    parser.add_argument("--engine", default=None, choices=list(SAFETY_ENGINES), help="safety engine for --op safety")
+    parser.add_argument("--workers", type=int, default=1, help="process pool size for the enumerate count")
+    parser.add_argument("--limit", type=int, default=MAX_PRINTED_SEQUENCES, help="sequences to list for enumerate")
+    parser.add_argument("--script", help="request script for --op requests (JSON or CSV)")
+    parser.add_argument("--policy", default="fifo", choices=["fifo", "max_granted"], help="batch policy for --op requests (max_granted: smallest requests first, a heuristic)")
+    parser.add_argument("--output", help="write JSON results here instead of stdout")
+    args = parser.parse_args(argv)
+
+    try:
+        maxm, alloc, available = load_state(args.state, args.max_path, args.alloc_path, args.available_path)
+    except (OSError, ValueError) as e:
+        print(f"Invalid input: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    arrays = np is not None and isinstance(maxm, np.ndarray)
+    engine = args.engine or ("numpy" if arrays else "list")
+    if engine == "numpy" and np is None:
+        parser.error("the numpy engine requires NumPy to be installed")
+    n, m = len(maxm), len(available)
+    result = {"op": args.op, "n": n, "m": m}
+
+    if args.op == "safety":
+        check = get_safety_engine(engine)
+        if engine != "numpy":
+            maxm, alloc, available = state_as_lists(maxm, alloc, available)
+        elif arrays:
+            available = np.asarray(available)
+        start = time.perf_counter()
+        safe, seq = check(maxm, alloc, available)
+        result.update(engine=engine, safe=safe, sequence=seq, seconds=time.perf_counter() - start)
+    elif args.op == "enumerate":
+        maxm, alloc, available = state_as_lists(maxm, alloc, available)
+        result.update(count=count_safe_sequences(maxm, alloc, available, workers=args.workers),
+                      sequences=list(iter_safe_sequences(maxm, alloc, available, limit=args.limit)))
+    else:
+        if not args.script:
+            parser.error("--op requests needs --script")
+        try:
+            requests = load_request_script(args.script, m)
+        except (OSError, ValueError) as e:
+            print(f"Invalid input: {e}", file=sys.stderr)
+            sys.exit(1)
+        maxm, alloc, available = state_as_lists(maxm, alloc, available)
+        verdicts, state, stats = request_batch(maxm, alloc, available, requests, args.policy)
+        result.update(verdicts=[{"pid": pid, "granted": g, "message": msg} for pid, g, msg in verdicts],
+                      stats=stats, allocation=state.alloc, available=state.available,
+                      safe=state.safe, sequence=state.safe_seq)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(result, f)
+    else:
+        json.dump(result, sys.stdout)
+        print()
+    return result
+
 def main():
     print("=== Banker's Algorithm Simulator ===")
     # Input sizes
@@ -241,13 +868,15 @@ def main():
                 print("System is NOT in a safe state (unsafe).")
 
         elif choice == "3":
-            sequences = find_all_safe_sequences(maxm, alloc, available)
-            if not sequences:
+            total = count_safe_sequences(maxm, alloc, available)
+            if total == 0:
                 print("No safe sequences exist for the current state.")
             else:
-                print(f"Found {len(sequences)} safe sequence(s):")
-                for idx, s in enumerate(sequences, 1):
+                print(f"Found {total} safe sequence(s):")
+                for idx, s in enumerate(iter_safe_sequences(maxm, alloc, available, limit=MAX_PRINTED_SEQUENCES), 1):
                     print(f"{idx}: ", " -> ".join("P"+str(x) for x in s))
+                if total > MAX_PRINTED_SEQUENCES:
+                    print(f"... showing first {MAX_PRINTED_SEQUENCES} of {total}.")
 
         elif choice == "4":
             try:
@@ -305,4 +934,7 @@ def main():
             print("Invalid choice. Enter 1..7.")
 
 if __name__ == "__main__":
-    main()
+    if len(sys.argv) > 1:
+        run_batch()
+    else:
+        main()
@@ -0,0 +1,85 @@
+"""
+Load generator for bank_server.py.
+
+Opens several concurrent client connections; each client repeatedly requests a
+small random vector for its own process and then releases it. Reports
+admission latency (p50/p99) and throughput for the request commands.
+
+Run:  python bank_loadgen.py --port 7000 --clients 16 --ops 500
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+from typing import List
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    k = min(len(sorted_values) - 1, int(round(q / 100 * (len(sorted_values) - 1))))
+    return sorted_values[k]
+
+
+async def call(reader: asyncio.StreamReader, writer: asyncio.StreamWriter, cmd: dict) -> dict:
+    writer.write((json.dumps(cmd) + "\n").encode())
+    await writer.drain()
+    return json.loads(await reader.readline())
+
+
+async def client(cid: int, args, n: int, m: int, latencies: List[float], outcomes: dict):
+    if args.unix:
+        reader, writer = await asyncio.open_unix_connection(args.unix)
+    else:
+        reader, writer = await asyncio.open_connection(args.host, args.port)
+    rng = random.Random(args.seed + cid)
+    pid = cid % n
+    for _ in range(args.ops):
+        req = [rng.randint(0, args.max_req) for _ in range(m)]
+        start = time.perf_counter()
+        reply = await call(reader, writer, {"op": "request", "pid": pid, "req": req, "wait": not args.no_wait})
+        latencies.append(time.perf_counter() - start)
+        outcomes[reply.get("status", "error")] = outcomes.get(reply.get("status", "error"), 0) + 1
+        await call(reader, writer, {"op": "release", "pid": pid})
+    writer.close()
+
+
+async def run(args):
+    if args.unix:
+        reader, writer = await asyncio.open_unix_connection(args.unix)
+    else:
+        reader, writer = await asyncio.open_connection(args.host, args.port)
+    snap = await call(reader, writer, {"op": "snapshot"})
+    writer.close()
+    n, m = len(snap["max"]), len(snap["available"])
+
+    latencies: List[float] = []
+    outcomes: dict = {}
+    start = time.perf_counter()
+    await asyncio.gather(*(client(c, args, n, m, latencies, outcomes) for c in range(args.clients)))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    print(f"Requests: {len(latencies)} in {elapsed:.3f}s ({len(latencies) / elapsed:.1f} req/s)")
+    print("Outcomes:", outcomes)
+    print(f"Admission latency p50 = {percentile(latencies, 50) * 1e3:.3f} ms, "
+          f"p99 = {percentile(latencies, 99) * 1e3:.3f} ms, max = {latencies[-1] * 1e3:.3f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load generator for the Banker's service")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=7000)
+    parser.add_argument("--unix", help="connect to this Unix socket instead of TCP")
+    parser.add_argument("--clients", type=int, default=8)
+    parser.add_argument("--ops", type=int, default=200, help="request/release pairs per client")
+    parser.add_argument("--max-req", type=int, default=1, help="largest value in a random request vector")
+    parser.add_argument("--no-wait", action="store_true", help="reject instead of parking requests")
+    parser.add_argument("--seed", type=int, default=0)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+"""
+Banker's Algorithm resource-manager service.
+
+A lock-protected BankerState core shared by all clients, served over asyncio
+(TCP or Unix socket). The protocol is one JSON object per line:
+
+  {"op": "request", "pid": 1, "req": [1, 0, 2]}        (add "wait": false to never park)
+  {"op": "release", "pid": 1}
+  {"op": "safe"}
+  {"op": "snapshot"}
+
+A request that only fails because request > available is parked and retried
+automatically whenever a release returns resources; its reply is sent once it
+is granted. Every other request gets an immediate reply.
+
+Run:  python bank_server.py state.json --port 7000
+where state.json holds {"max": [[...]], "allocation": [[...]], "available": [...]}
+(anything bank2.load_state accepts).
+"""
+
+import argparse
+import asyncio
+import json
+import threading
+from collections import deque
+from typing import Callable, List, Tuple
+
+import bank2
+from bank2 import BankerState, is_less_or_equal
+
+
+class BankerService:
+    """Thread-safe Banker's core with a FIFO queue of parked (waiting) requests."""
+
+    def __init__(self, state: BankerState):
+        self.state = state
+        self._lock = threading.Lock()
+        self._waiting = deque()  # (pid, req, on_grant)
+
+    def request(self, pid: int, req: List[int], on_grant: Callable[[bool, str], None] = None) -> Tuple[str, str]:
+        """
+        Try to grant req for pid. Returns (status, message) where status is
+        "granted", "denied" or "waiting". A request is parked ("waiting") only when
+        on_grant is given and it fails because request > available; on_grant(granted,
+        message) is called once it is decided.
+        """
+        with self._lock:
+            state = self.state
+            if (on_grant is not None and 0 <= pid < state.n and len(req) == state.m
+                    and is_less_or_equal(req, state.need[pid])
+                    and not is_less_or_equal(req, state.available)):
+                self._waiting.append((pid, req, on_grant))
+                return "waiting", "Resources not available now; request parked until a release."
+            granted, msg = state.request(pid, req)
+            return ("granted" if granted else "denied"), msg
+
+    def release(self, pid: int) -> Tuple[bool, str, int]:
+        """Release pid's allocation, then retry parked requests. Returns (ok, message, retried_grants)."""
+        with self._lock:
+            ok, msg = self.state.release(pid)
+            granted = self._retry_waiting() if ok else 0
+        return ok, msg, granted
+
+    def _retry_waiting(self) -> int:
+        """Retry parked requests in FIFO order; caller holds the lock."""
+        state = self.state
+        still_waiting = deque()
+        granted_count = 0
+        while self._waiting:
+            pid, req, on_grant = self._waiting.popleft()
+            if not is_less_or_equal(req, state.need[pid]):
+                on_grant(False, f"Process P{pid} has request greater than its need. Denied.")
+            elif not is_less_or_equal(req, state.available):
+                still_waiting.append((pid, req, on_grant))
+            else:
+                granted, msg = state.request(pid, req)
+                if granted:
+                    granted_count += 1
+                    on_grant(True, msg)
+                else:
+                    # unsafe for now; a later release may make it safe
+                    still_waiting.append((pid, req, on_grant))
+        self._waiting = still_waiting
+        return granted_count
+
+    def query_safe(self) -> Tuple[bool, List[int]]:
+        with self._lock:
+            return self.state.is_safe()
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            state = self.state
+            return {
+                "max": [row.copy() for row in state.maxm],
+                "allocation": [row.copy() for row in state.alloc],
+                "need": [row.copy() for row in state.need],
+                "available": state.available.copy(),
+                "waiting": len(self._waiting),
+            }
+
+
+async def handle_client(service: BankerService, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+    loop = asyncio.get_running_loop()
+    try:
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            try:
+                cmd = json.loads(line)
+                reply = await dispatch(service, loop, cmd)
+            except (ValueError, KeyError, TypeError, IndexError) as e:
+                reply = {"ok": False, "error": f"Bad command: {e}"}
+            writer.write((json.dumps(reply) + "\n").encode())
+            await writer.drain()
+    except ConnectionError:
+        pass
+    finally:
+        writer.close()
+
+
+async def dispatch(service: BankerService, loop: asyncio.AbstractEventLoop, cmd: dict) -> dict:
+    op = cmd["op"]
+    if op == "request":
+        pid, req = int(cmd["pid"]), [int(x) for x in cmd["req"]]
+        m = service.state.m
+        if len(req) != m:
+            return {"ok": False, "error": f"Request must have {m} entries, got {len(req)}."}
+        if any(x < 0 for x in req):
+            return {"ok": False, "error": "Request entries must be non-negative."}
+        fut = loop.create_future()
+        on_grant = None
+        if cmd.get("wait", True):
+            def on_grant(granted, msg):
+                def resolve():
+                    if not fut.done():
+                        fut.set_result((granted, msg))
+                loop.call_soon_threadsafe(resolve)
+        status, msg = service.request(pid, req, on_grant)
+        if status == "waiting":
+            granted, msg = await fut
+            status = "granted" if granted else "denied"
+        return {"ok": True, "status": status, "message": msg}
+    if op == "release":
+        ok, msg, retried = service.release(int(cmd["pid"]))
+        return {"ok": ok, "message": msg, "retried_grants": retried}
+    if op == "safe":
+        safe, seq = service.query_safe()
+        return {"ok": True, "safe": safe, "sequence": seq}
+    if op == "snapshot":
+        return {"ok": True, **service.snapshot()}
+    raise ValueError(f"unknown op {op!r}")
+
+
+async def serve(service: BankerService, host: str = "127.0.0.1", port: int = 7000, unix: str = None):
+    def handler(reader, writer):
+        return handle_client(service, reader, writer)
+
+    if unix:
+        server = await asyncio.start_unix_server(handler, path=unix)
+    else:
+        server = await asyncio.start_server(handler, host, port)
+    async with server:
+        await server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Banker's Algorithm resource-manager service")
+    parser.add_argument("state", help="JSON or .npz file with max, allocation and available")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=7000)
+    parser.add_argument("--unix", help="serve on this Unix socket path instead of TCP")
+    args = parser.parse_args()
+
+    maxm, alloc, available = bank2.state_as_lists(*bank2.load_state(args.state))
+    service = BankerService(BankerState(maxm, alloc, available))
+    where = args.unix or f"{args.host}:{args.port}"
+    print(f"Banker's service listening on {where}")
+    try:
+        asyncio.run(serve(service, args.host, args.port, args.unix))
+    except KeyboardInterrupt:
+        print("Shutting down.")
+
+
+if __name__ == "__main__":
+    main()
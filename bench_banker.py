@@ -0,0 +1,211 @@
+"""
+Benchmark harness for the Banker's Algorithm implementations.
+
+Generates random states (safe, unsafe and borderline), sweeps over n, m and
+allocation density, and times every available engine for:
+  - safety   : bank2 safety engines and safe.is_safe
+  - request  : bank2.request_resources (every engine) vs BankerState.request
+               on the same request script, plus BankerState construction
+  - enumerate: count_safe_sequences / find_all_safe_sequences (small n only)
+Reports ops/sec and peak memory (tracemalloc) and saves JSON results so runs
+from different versions can be compared.
+
+Run:  python bench_banker.py --n 100 1000 --m 4 16 --density 0.3 1.0 --output bench.json
+"""
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from typing import Callable, List
+
+import bank2
+import safe
+
+ENUMERATE_MAX_N = 9  # enumeration is exponential; only time it on small states
+
+
+def make_state(n: int, m: int, density: float, kind: str, rng: random.Random, max_claim: int = 10):
+    """
+    Random (maxm, alloc, available) of the given kind:
+      borderline - safe, but Available is exactly the minimum one safe order needs
+      safe       - borderline plus random slack
+      unsafe     - borderline with Available reduced until the state is unsafe
+                   (or one Max raised past the total if that is not enough)
+    density is the fraction of non-zero Allocation entries.
+    """
+    maxm = [[rng.randint(0, max_claim) for _ in range(m)] for _ in range(n)]
+    alloc = [[rng.randint(0, x) if rng.random() < density else 0 for x in row] for row in maxm]
+    need = bank2.compute_need(maxm, alloc)
+    order = list(range(n))
+    rng.shuffle(order)
+    # smallest Available for which `order` is a safe sequence
+    available = [0]*m
+    released = [0]*m
+    for i in order:
+        for j in range(m):
+            available[j] = max(available[j], need[i][j] - released[j])
+            released[j] += alloc[i][j]
+    if kind == "safe":
+        available = [a + rng.randint(0, max_claim) for a in available]
+    elif kind == "unsafe":
+        while bank2.safety_check(maxm, alloc, available)[0]:
+            positive = [j for j in range(m) if available[j] > 0]
+            if not positive:
+                # Available is exhausted, but processes with zero Need still finish and
+                # free their allocation. Raise one Max above everything in the system.
+                i, j = rng.randrange(n), rng.randrange(m)
+                maxm[i][j] = alloc[i][j] + sum(row[j] for row in alloc) + 1
+                break
+            available[rng.choice(positive)] -= 1
+    elif kind != "borderline":
+        raise ValueError(f"Unknown state kind {kind!r}; choose safe, unsafe or borderline.")
+    return maxm, alloc, available
+
+
+def measure(fn: Callable, repeat: int, setup: Callable = None) -> dict:
+    """
+    Time fn over repeat calls, then run it once more under tracemalloc for peak memory.
+    With setup, each call is fn(setup()) and only fn is timed.
+    """
+    elapsed = 0.0
+    for _ in range(repeat):
+        arg = setup() if setup else None
+        start = time.perf_counter()
+        fn(arg) if setup else fn()
+        elapsed += time.perf_counter() - start
+    arg = setup() if setup else None
+    tracemalloc.start()
+    fn(arg) if setup else fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "seconds_per_op": elapsed / repeat,
+        "ops_per_sec": repeat / elapsed if elapsed > 0 else float("inf"),
+        "peak_bytes": peak,
+    }
+
+
+def safety_cases(maxm, alloc, available) -> dict:
+    n = len(maxm)
+    cases = {name: (lambda check=check: check(maxm, alloc, available))
+             for name, check in bank2.SAFETY_ENGINES.items()
+             if name != "numpy" or bank2.np is not None}
+    procs = list(range(n))
+    cases["safe.is_safe"] = lambda: safe.is_safe(procs, available, maxm, alloc)
+    return cases
+
+
+def request_script(maxm, alloc, available, rng: random.Random, count: int = 50) -> List[tuple]:
+    """
+    A sequence of requests that each fit the pid's Need and Available at the time
+    they are made (given the grants before them), so every one reaches the
+    safety check. Unsafe ones are denied and leave the state unchanged.
+    """
+    state = bank2.BankerState(maxm, alloc, available)
+    n, m = len(maxm), len(available)
+    reqs = []
+    for _ in range(count):
+        pid = rng.randrange(n)
+        req = [rng.randint(0, min(state.need[pid][j], state.available[j])) for j in range(m)]
+        reqs.append((pid, req))
+        state.request(pid, req)
+    return reqs
+
+
+def request_cases(maxm, alloc, available, reqs) -> List[tuple]:
+    """
+    (name, fn, setup, calls) for the request op. Every implementation decides the
+    same script and commits its grants, so all of them make the same decisions.
+    Building the BankerState is timed as its own case.
+    """
+    def fresh():
+        return [row.copy() for row in alloc], available.copy()
+
+    def stateless(engine):
+        def run(copies):
+            alloc_c, avail_c = copies
+            for pid, req in reqs:
+                granted, _ = bank2.request_resources(maxm, alloc_c, avail_c, pid, req, engine=engine)
+                if granted:
+                    avail_c[:] = bank2.sub_vec(avail_c, req)
+                    alloc_c[pid] = bank2.add_vec(alloc_c[pid], req)
+        return run
+
+    def stateful(state):
+        for pid, req in reqs:
+            state.request(pid, req)
+
+    cases = [(f"request_resources[{name}]", stateless(name), fresh, len(reqs))
+             for name in bank2.SAFETY_ENGINES if name != "numpy" or bank2.np is not None]
+    cases.append(("BankerState.request", stateful, lambda: bank2.BankerState(maxm, alloc, available), len(reqs)))
+    cases.append(("BankerState()", lambda: bank2.BankerState(maxm, alloc, available), None, 1))
+    return cases
+
+
+def enumerate_cases(maxm, alloc, available) -> dict:
+    cases = {"count_safe_sequences": lambda: bank2.count_safe_sequences(maxm, alloc, available)}
+    if len(maxm) <= 8:
+        cases["find_all_safe_sequences"] = lambda: bank2.find_all_safe_sequences(maxm, alloc, available)
+    return cases
+
+
+def run(ns: List[int], ms: List[int], densities: List[float], kinds: List[str], repeat: int, seed: int) -> List[dict]:
+    results = []
+    for n in ns:
+        for m in ms:
+            for density in densities:
+                for kind in kinds:
+                    rng = random.Random(f"{seed}-{n}-{m}-{density}-{kind}")
+                    state = make_state(n, m, density, kind, rng)
+                    base = {"n": n, "m": m, "density": density, "kind": kind}
+                    for name, fn in safety_cases(*state).items():
+                        results.append({**base, "op": "safety", "impl": name, **measure(fn, repeat)})
+                    reqs = request_script(*state, rng)
+                    for name, fn, setup, per_call in request_cases(*state, reqs):
+                        r = measure(fn, repeat, setup)
+                        r["seconds_per_op"] /= per_call
+                        r["ops_per_sec"] *= per_call
+                        results.append({**base, "op": "request", "impl": name, **r})
+                    if n <= ENUMERATE_MAX_N:
+                        for name, fn in enumerate_cases(*state).items():
+                            results.append({**base, "op": "enumerate", "impl": name, **measure(fn, repeat)})
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the Banker's Algorithm implementations")
+    parser.add_argument("--n", type=int, nargs="+", default=[8, 100, 1000], help="numbers of processes")
+    parser.add_argument("--m", type=int, nargs="+", default=[3, 16], help="numbers of resource types")
+    parser.add_argument("--density", type=float, nargs="+", default=[0.5, 1.0], help="allocation densities")
+    parser.add_argument("--kinds", nargs="+", default=["safe", "unsafe", "borderline"])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="save results as JSON here")
+    args = parser.parse_args()
+
+    results = run(args.n, args.m, args.density, args.kinds, args.repeat, args.seed)
+
+    print(f"{'n':>6} {'m':>4} {'dens':>5} {'kind':>10} {'op':>9} {'impl':>26} {'ops/sec':>12} {'peak KiB':>10}")
+    for r in results:
+        print(f"{r['n']:>6} {r['m']:>4} {r['density']:>5} {r['kind']:>10} {r['op']:>9} {r['impl']:>26} "
+              f"{r['ops_per_sec']:>12.1f} {r['peak_bytes'] / 1024:>10.1f}")
+
+    if args.output:
+        meta = {
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "numpy": getattr(bank2.np, "__version__", None),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "args": vars(args),
+        }
+        with open(args.output, "w") as f:
+            json.dump({"meta": meta, "results": results}, f, indent=1)
+        print(f"Saved {len(results)} results to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,210 @@
+"""
+Deadlock detection for multi-instance resources (no Max claims needed).
+
+1) detect_deadlock: the classic detection algorithm over Allocation and Request.
+2) DeadlockDetector: keeps the wait-for graph (process -> resource -> holders)
+   up to date incrementally as requests and releases arrive. A check started from
+   one process only walks the processes it transitively waits on, so it touches the
+   affected component instead of the whole system.
+"""
+
+import heapq
+from collections import deque
+from typing import Iterable, List, Set, Tuple
+
+from bank2 import add_vec, is_less_or_equal
+
+
+def detect_deadlock(alloc: List[List[int]], request: List[List[int]], available: List[int]) -> List[int]:
+    """
+    Multi-instance deadlock detection algorithm.
+    Returns the sorted list of deadlocked processes (empty if there is no deadlock).
+    """
+    return _reduce(range(len(alloc)), alloc, request, available)
+
+
+def _reduce(procs: Iterable[int], alloc: List[List[int]], request: List[List[int]], available: List[int]) -> List[int]:
+    """Run the detection reduction over procs only; return those that cannot finish."""
+    work = available.copy()
+    pending = [i for i in procs if any(alloc[i])]
+    while True:
+        progressed = False
+        still = []
+        for i in pending:
+            if is_less_or_equal(request[i], work):
+                work = add_vec(work, alloc[i])
+                progressed = True
+            else:
+                still.append(i)
+        pending = still
+        if not progressed or not pending:
+            break
+    return sorted(pending)
+
+
+def suggest_victim(alloc: List[List[int]], deadlocked: List[int]) -> int:
+    """Pick the deadlocked process holding the most resource units (lowest pid on ties), or -1."""
+    if not deadlocked:
+        return -1
+    return max(deadlocked, key=lambda i: (sum(alloc[i]), -i))
+
+
+class DeadlockDetector:
+    """
+    Incremental detector. Requests are granted when resources are available and
+    otherwise recorded as outstanding; releases hand freed resources to waiting
+    processes. holders[r] and waiters[r] (the wait-for graph through resource r)
+    are updated in O(m) per event.
+    Each blocked process is also filed in blocked_on[r], a heap keyed by its
+    outstanding amount of one resource r it cannot get yet. A release of r only
+    pops the entries that now fit, so it never scans the other waiters.
+    """
+
+    def __init__(self, alloc: List[List[int]], available: List[int], request: List[List[int]] = None):
+        self.n = len(alloc)
+        self.m = len(available)
+        self.alloc = [row.copy() for row in alloc]
+        self.available = available.copy()
+        self.request = [row.copy() for row in request] if request is not None else [[0]*self.m for _ in range(self.n)]
+        self.holders: List[Set[int]] = [set() for _ in range(self.m)]
+        self.waiters: List[Set[int]] = [set() for _ in range(self.m)]
+        self.blocked_on: List[List[Tuple[int, int]]] = [[] for _ in range(self.m)]  # heaps of (amount, pid)
+        for i in range(self.n):
+            for j in range(self.m):
+                if self.alloc[i][j] > 0:
+                    self.holders[j].add(i)
+                if self.request[i][j] > 0:
+                    self.waiters[j].add(i)
+            if self.is_blocked(i):
+                self._file(i)
+
+    def _file(self, pid: int) -> bool:
+        """
+        File blocked pid under the first resource it cannot get. Returns False if
+        its whole request fits now. A request that already fits is filed under
+        its first requested resource, so the next release of it grants it.
+        """
+        row = self.request[pid]
+        first = -1
+        for j, r in enumerate(row):
+            if r > self.available[j]:
+                heapq.heappush(self.blocked_on[j], (r, pid))
+                return True
+            if r > 0 and first == -1:
+                first = j
+        heapq.heappush(self.blocked_on[first], (row[first], pid))
+        return False
+
+    def is_blocked(self, pid: int) -> bool:
+        return any(self.request[pid])
+
+    def request_resources(self, pid: int, req: List[int]) -> bool:
+        """
+        Request req for pid. Granted at once if it fits in Available (returns True);
+        otherwise it is added to pid's outstanding request (returns False).
+        """
+        blocked = self.is_blocked(pid)
+        if blocked or not is_less_or_equal(req, self.available):
+            row = self.request[pid]
+            for j, r in enumerate(req):
+                if r > 0:
+                    row[j] += r
+                    self.waiters[j].add(pid)
+            if not blocked:
+                self._file(pid)
+            # an already blocked pid keeps its heap entry; a grown request is
+            # re-checked in full when that entry is popped
+            return False
+        self._allocate(pid, req)
+        return True
+
+    def _allocate(self, pid: int, req: List[int]):
+        row = self.alloc[pid]
+        for j, r in enumerate(req):
+            if r > 0:
+                self.available[j] -= r
+                row[j] += r
+                self.holders[j].add(pid)
+
+    def release(self, pid: int, vec: List[int] = None) -> List[int]:
+        """
+        Release vec from pid (everything pid holds if vec is None) and grant any
+        outstanding requests on the freed resource types that now fit.
+        Returns the pids whose requests were granted, in grant order.
+        """
+        row = self.alloc[pid]
+        if vec is None:
+            vec = row.copy()
+        freed = []
+        for j, r in enumerate(vec):
+            if r > 0:
+                r = min(r, row[j])
+                row[j] -= r
+                self.available[j] += r
+                if row[j] == 0:
+                    self.holders[j].discard(pid)
+                freed.append(j)
+        candidates = []
+        for j in freed:
+            heap = self.blocked_on[j]
+            while heap and heap[0][0] <= self.available[j]:
+                candidates.append(heapq.heappop(heap)[1])
+        granted = []
+        for w in sorted(candidates):
+            if is_less_or_equal(self.request[w], self.available):
+                req = self.request[w]
+                self.request[w] = [0]*self.m
+                for j, r in enumerate(req):
+                    if r > 0:
+                        self.waiters[j].discard(w)
+                self._allocate(w, req)
+                granted.append(w)
+            else:
+                self._file(w)
+        return granted
+
+    def component(self, pid: int) -> List[int]:
+        """Processes pid transitively waits on (including pid), via resource holders."""
+        seen = {pid}
+        queue = deque([pid])
+        while queue:
+            p = queue.popleft()
+            for j, r in enumerate(self.request[p]):
+                if r > 0:
+                    for q in self.holders[j]:
+                        if q not in seen:
+                            seen.add(q)
+                            queue.append(q)
+        return sorted(seen)
+
+    def detect(self, pid: int = None) -> Tuple[List[int], int]:
+        """
+        Return (deadlocked, victim). With pid, only pid's component is examined;
+        this is exact for that component because every holder of a resource its
+        members wait on is inside it. Without pid the whole system is checked.
+        victim is -1 when nothing is deadlocked.
+        """
+        if pid is None:
+            deadlocked = detect_deadlock(self.alloc, self.request, self.available)
+        elif not self.is_blocked(pid):
+            deadlocked = []
+        else:
+            deadlocked = _reduce(self.component(pid), self.alloc, self.request, self.available)
+        return deadlocked, suggest_victim(self.alloc, deadlocked)
+
+
+# ------------------------------
+# Example
+# ------------------------------
+if __name__ == "__main__":
+    allocation = [[0, 1, 0], [2, 0, 0], [3, 0, 3], [2, 1, 1], [0, 0, 2]]
+    request = [[0, 0, 0], [2, 0, 2], [0, 0, 1], [1, 0, 0], [0, 0, 2]]
+    available = [0, 0, 0]
+
+    print("Deadlocked (classic):", detect_deadlock(allocation, request, available))
+
+    det = DeadlockDetector(allocation, available, request)
+    deadlocked, victim = det.detect(1)
+    print("Deadlocked around P1:", ["P"+str(x) for x in deadlocked])
+    if victim != -1:
+        print(f"Suggested victim: P{victim}")
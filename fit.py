@@ -1,7 +1,11 @@
 # -------------------------------------------
 # Memory Allocation Algorithms:
-# First Fit, Best Fit, Worst Fit, Next Fit
+# First Fit, Best Fit, Worst Fit, Next Fit,
+# Buddy System, Segregated Fit
 # -------------------------------------------
+import heapq
+from bisect import bisect_left, insort
+
 
 def first_fit(blocks, processes):
     block_remaining = blocks.copy()
@@ -88,6 +92,273 @@ def next_fit(blocks, processes):
     return allocation, internal_frag, block_remaining
 
 
+# -------------------------------------------
+# Indexed allocators (same results, faster on many blocks)
+# -------------------------------------------
+class MaxSegmentTree:
+    """Segment tree over block_remaining keeping the max of every range."""
+
+    def __init__(self, values):
+        self.n = len(values)
+        size = 1
+        while size < max(self.n, 1):
+            size *= 2
+        self.size = size
+        self.tree = [-1] * (2 * size)
+        self.tree[size:size + self.n] = values
+        for k in range(size - 1, 0, -1):
+            self.tree[k] = max(self.tree[2 * k], self.tree[2 * k + 1])
+
+    def update(self, i, value):
+        k = i + self.size
+        self.tree[k] = value
+        k //= 2
+        while k:
+            self.tree[k] = max(self.tree[2 * k], self.tree[2 * k + 1])
+            k //= 2
+
+    def find_first(self, p):
+        """Leftmost index with value >= p, or -1. O(log n)."""
+        tree = self.tree
+        if tree[1] < p:
+            return -1
+        k = 1
+        while k < self.size:
+            k = 2 * k if tree[2 * k] >= p else 2 * k + 1
+        return k - self.size if k - self.size < self.n else -1
+
+    def find_first_from(self, start, p):
+        """Leftmost index >= start with value >= p, or -1. O(log n)."""
+        if start >= self.n:
+            return -1
+        tree = self.tree
+        k = start + self.size
+        if tree[k] >= p:
+            return start
+        # climb until a right sibling (covering later indices) holds a fit
+        while k > 1:
+            if k % 2 == 0 and tree[k + 1] >= p:
+                k += 1
+                break
+            k //= 2
+        else:
+            return -1
+        while k < self.size:
+            k = 2 * k if tree[2 * k] >= p else 2 * k + 1
+        return k - self.size if k - self.size < self.n else -1
+
+
+def first_fit_indexed(blocks, processes):
+    block_remaining = blocks.copy()
+    allocation = [-1] * len(processes)
+    internal_frag = [0] * len(processes)
+    tree = MaxSegmentTree(block_remaining)
+
+    for i, p in enumerate(processes):
+        j = tree.find_first(p)
+        if j != -1:
+            allocation[i] = j
+            internal_frag[i] = block_remaining[j] - p
+            block_remaining[j] -= p
+            tree.update(j, block_remaining[j])
+
+    return allocation, internal_frag, block_remaining
+
+
+def next_fit_indexed(blocks, processes):
+    """Next Fit with the same roving pointer as next_fit; the circular search uses the segment tree."""
+    block_remaining = blocks.copy()
+    allocation = [-1] * len(processes)
+    internal_frag = [0] * len(processes)
+    tree = MaxSegmentTree(block_remaining)
+
+    last = 0   # start point
+
+    for i, p in enumerate(processes):
+        j = tree.find_first_from(last, p)
+        if j == -1:
+            j = tree.find_first(p)   # wrap around: anything found here is before last
+        if j != -1:
+            allocation[i] = j
+            internal_frag[i] = block_remaining[j] - p
+            block_remaining[j] -= p
+            tree.update(j, block_remaining[j])
+            last = j
+
+    return allocation, internal_frag, block_remaining
+
+
+def best_fit_indexed(blocks, processes):
+    """Best Fit over a sorted list of (remaining, index); bisect finds the smallest block >= p."""
+    block_remaining = blocks.copy()
+    allocation = [-1] * len(processes)
+    internal_frag = [0] * len(processes)
+    free = sorted((b, j) for j, b in enumerate(block_remaining))
+
+    for i, p in enumerate(processes):
+        k = bisect_left(free, (p, -1))
+        if k < len(free):
+            b, j = free.pop(k)
+            allocation[i] = j
+            internal_frag[i] = b - p
+            block_remaining[j] -= p
+            insort(free, (block_remaining[j], j))
+
+    return allocation, internal_frag, block_remaining
+
+
+def worst_fit_indexed(blocks, processes):
+    """Worst Fit over a max-heap of (-remaining, index) with lazy removal of stale entries."""
+    block_remaining = blocks.copy()
+    allocation = [-1] * len(processes)
+    internal_frag = [0] * len(processes)
+    heap = [(-b, j) for j, b in enumerate(block_remaining)]
+    heapq.heapify(heap)
+
+    for i, p in enumerate(processes):
+        while heap and -heap[0][0] != block_remaining[heap[0][1]]:
+            heapq.heappop(heap)   # stale entry for a block that has shrunk
+        if heap and -heap[0][0] >= p:
+            j = heap[0][1]
+            allocation[i] = j
+            internal_frag[i] = block_remaining[j] - p
+            block_remaining[j] -= p
+            heapq.heapreplace(heap, (-block_remaining[j], j))
+
+    return allocation, internal_frag, block_remaining
+
+
+# -------------------------------------------
+# Buddy system and segregated (size-class) fit
+# -------------------------------------------
+def buddy_order(size):
+    """Smallest order k with 2**k >= size."""
+    return max(size - 1, 0).bit_length()
+
+
+class BuddyAllocator:
+    """
+    Binary buddy allocator over one block of `size` units. free_maps[k] is a
+    bitmap (Python int) with bit i set when the chunk [i * 2**k, (i+1) * 2**k)
+    is free. A block that is not a power of two starts as its binary
+    decomposition (largest chunk first, so every chunk is aligned).
+    """
+
+    def __init__(self, size):
+        self.max_order = max(size.bit_length(), 1)
+        self.free_maps = [0] * (self.max_order + 1)
+        offset = 0
+        for k in range(self.max_order, -1, -1):
+            if size & (1 << k):
+                self.free_maps[k] |= 1 << (offset >> k)
+                offset += 1 << k
+
+    def alloc(self, size):
+        """Return the offset of a 2**buddy_order(size) chunk, or -1. Splits larger chunks as needed."""
+        k = buddy_order(size)
+        o = k
+        while o <= self.max_order and not self.free_maps[o]:
+            o += 1
+        if o > self.max_order:
+            return -1
+        bits = self.free_maps[o]
+        idx = (bits & -bits).bit_length() - 1   # lowest-address free chunk
+        self.free_maps[o] &= ~(1 << idx)
+        while o > k:                             # split, keeping the left half
+            o -= 1
+            idx *= 2
+            self.free_maps[o] |= 1 << (idx + 1)
+        return idx << k
+
+    def free(self, offset, size):
+        """Free a chunk returned by alloc, merging it with free buddies."""
+        k = buddy_order(size)
+        idx = offset >> k
+        while k < self.max_order and self.free_maps[k] & (1 << (idx ^ 1)):
+            self.free_maps[k] &= ~(1 << (idx ^ 1))
+            idx //= 2
+            k += 1
+        self.free_maps[k] |= 1 << idx
+
+    def largest_free(self):
+        for k in range(self.max_order, -1, -1):
+            if self.free_maps[k]:
+                return 1 << k
+        return 0
+
+
+def buddy_fit(blocks, processes):
+    """Each block is a buddy arena; a process goes to the lowest-index block with a big enough chunk."""
+    block_remaining = blocks.copy()
+    allocation = [-1] * len(processes)
+    internal_frag = [0] * len(processes)
+    arenas = [BuddyAllocator(b) for b in blocks]
+    tree = MaxSegmentTree([a.largest_free() for a in arenas])
+
+    for i, p in enumerate(processes):
+        chunk = 1 << buddy_order(p)
+        j = tree.find_first(chunk)
+        if j != -1:
+            arenas[j].alloc(p)
+            allocation[i] = j
+            internal_frag[i] = chunk - p
+            block_remaining[j] -= chunk
+            tree.update(j, arenas[j].largest_free())
+
+    return allocation, internal_frag, block_remaining
+
+
+def size_classes(limit):
+    """Default size classes up to limit: 8, 12, 16, 24, 32, 48, ... (two per power of two)."""
+    classes = []
+    c = 8
+    while not classes or classes[-1] < limit:
+        classes += [c, c * 3 // 2]
+        c *= 2
+    return classes
+
+
+def segregated_fit(blocks, processes, classes=None):
+    """
+    Slab-style segregated fit. A process is rounded up to its size class. A block
+    is dedicated to one class the first time it is used and carved into objects of
+    that size; later processes of the class fill the lowest-index slab with room
+    before a new block is taken.
+    """
+    block_remaining = blocks.copy()
+    allocation = [-1] * len(processes)
+    internal_frag = [0] * len(processes)
+    if classes is None:
+        classes = size_classes(max(processes, default=1))
+    unassigned = MaxSegmentTree(block_remaining)   # -1 once a block becomes a slab
+    slab_free = [0] * len(blocks)                  # free objects left in each slab
+    partial = {c: [] for c in classes}             # class -> min-heap of slabs with room
+
+    for i, p in enumerate(processes):
+        k = bisect_left(classes, p)
+        if k == len(classes):
+            continue
+        c = classes[k]
+        slabs = partial[c]
+        if slabs:
+            j = slabs[0]
+        else:
+            j = unassigned.find_first(c)
+            if j == -1:
+                continue
+            unassigned.update(j, -1)
+            slab_free[j] = block_remaining[j] // c
+            heapq.heappush(slabs, j)
+        allocation[i] = j
+        internal_frag[i] = c - p
+        block_remaining[j] -= c
+        slab_free[j] -= 1
+        if slab_free[j] == 0:
+            heapq.heappop(slabs)
+
+    return allocation, internal_frag, block_remaining
+
+
 # -------------------------------------------
 # Function to display results
 # -------------------------------------------
@@ -109,6 +380,30 @@ def display(method, blocks, processes, allocation, internal_frag, block_remainin
     print(f"External Fragmentation (total free space) = {external}")
 
 
+# -------------------------------------------
+# Strategies by name
+# -------------------------------------------
+STRATEGIES = {
+    "first_fit": first_fit,
+    "best_fit": best_fit,
+    "worst_fit": worst_fit,
+    "next_fit": next_fit,
+    "first_fit_indexed": first_fit_indexed,
+    "best_fit_indexed": best_fit_indexed,
+    "worst_fit_indexed": worst_fit_indexed,
+    "next_fit_indexed": next_fit_indexed,
+    "buddy_fit": buddy_fit,
+    "segregated_fit": segregated_fit,
+}
+
+
+def allocate(strategy, blocks, processes):
+    """Run the named strategy; returns (allocation, internal_frag, block_remaining)."""
+    if strategy not in STRATEGIES:
+        raise ValueError(f"Unknown strategy {strategy!r}; choose from {sorted(STRATEGIES)}")
+    return STRATEGIES[strategy](blocks, processes)
+
+
 # -------------------------------------------
 # Main Program (Modify input here)
 # -------------------------------------------
@@ -135,3 +430,11 @@ if __name__ == "__main__":
     # Next Fit
     a4, f4, r4 = next_fit(blocks, processes)
     display("Next Fit", blocks, processes, a4, f4, r4)
+
+    # Buddy System
+    a5, f5, r5 = buddy_fit(blocks, processes)
+    display("Buddy System", blocks, processes, a5, f5, r5)
+
+    # Segregated Fit
+    a6, f6, r6 = segregated_fit(blocks, processes)
+    display("Segregated Fit", blocks, processes, a6, f6, r6)
@@ -0,0 +1,102 @@
+# -------------------------------------------
+# Parameter sweep over placement strategies.
+#
+# Every (block distribution, request mix, repetition) workload is generated
+# from a deterministic seed, run through every strategy in a process pool,
+# and summarized as failure rate, fragmentation and time per placement.
+#
+# Run:  python fit_sweep.py --blocks 2000 --procs 2000 --reps 3 --workers 8 --output sweep.csv
+# -------------------------------------------
+import argparse
+import random
+import time
+
+from fit import STRATEGIES
+from sweep_common import run_grid, write_results
+
+
+# -------------------------------------------
+# Workload generators: (rng, count) -> list of sizes
+# -------------------------------------------
+BLOCK_DISTRIBUTIONS = {
+    "uniform": lambda rng, n: [rng.randint(64, 1024) for _ in range(n)],
+    "lognormal": lambda rng, n: [max(1, int(rng.lognormvariate(6, 0.8))) for _ in range(n)],
+    "bimodal": lambda rng, n: [rng.randint(32, 128) if rng.random() < 0.7 else rng.randint(1024, 4096)
+                               for _ in range(n)],
+}
+
+REQUEST_MIXES = {
+    "small": lambda rng, n: [rng.randint(1, 64) for _ in range(n)],
+    "large": lambda rng, n: [rng.randint(256, 1024) for _ in range(n)],
+    "mixed": lambda rng, n: [rng.randint(1, 64) if rng.random() < 0.8 else rng.randint(256, 2048)
+                             for _ in range(n)],
+}
+
+
+def make_workload(block_dist, mix, n_blocks, n_procs, seed):
+    """Same seed -> same workload, independent of the strategy being tested."""
+    rng = random.Random(f"{seed}-{block_dist}-{mix}")
+    blocks = BLOCK_DISTRIBUTIONS[block_dist](rng, n_blocks)
+    processes = REQUEST_MIXES[mix](rng, n_procs)
+    return blocks, processes
+
+
+def run_one(task):
+    """Run one (strategy, workload) cell."""
+    strategy, block_dist, mix, rep, n_blocks, n_procs, seed = task
+    blocks, processes = make_workload(block_dist, mix, n_blocks, n_procs, seed + rep)
+    start = time.perf_counter()
+    allocation, internal_frag, block_remaining = STRATEGIES[strategy](blocks, processes)
+    elapsed = time.perf_counter() - start
+    failed = sum(1 for a in allocation if a == -1)
+    return {
+        "strategy": strategy,
+        "block_dist": block_dist,
+        "mix": mix,
+        "rep": rep,
+        "blocks": n_blocks,
+        "processes": n_procs,
+        "failure_rate": failed / n_procs if n_procs else 0.0,
+        "internal_frag": sum(internal_frag),
+        "external_frag": sum(b for b in block_remaining if b > 0),
+        "largest_free": max(block_remaining, default=0),
+        "us_per_op": elapsed / n_procs * 1e6 if n_procs else 0.0,
+    }
+
+
+def sweep(strategies, block_dists, mixes, reps, n_blocks, n_procs, seed=0, workers=None):
+    """Run the full grid and return result rows in grid order (deterministic regardless of workers)."""
+    tasks = [(s, b, m, r, n_blocks, n_procs, seed)
+             for b in block_dists for m in mixes for r in range(reps) for s in strategies]
+    return run_grid(run_one, tasks, workers)
+
+
+# -------------------------------------------
+# Main Program
+# -------------------------------------------
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Sweep placement strategies over generated workloads")
+    parser.add_argument("--strategies", nargs="+", default=["first_fit_indexed", "best_fit_indexed",
+                                                            "worst_fit_indexed", "next_fit_indexed",
+                                                            "buddy_fit", "segregated_fit"],
+                        choices=sorted(STRATEGIES))
+    parser.add_argument("--block-dists", nargs="+", default=list(BLOCK_DISTRIBUTIONS), choices=list(BLOCK_DISTRIBUTIONS))
+    parser.add_argument("--mixes", nargs="+", default=list(REQUEST_MIXES), choices=list(REQUEST_MIXES))
+    parser.add_argument("--blocks", type=int, default=1000)
+    parser.add_argument("--procs", type=int, default=1000)
+    parser.add_argument("--reps", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None, help="process pool size (1 = run serially)")
+    parser.add_argument("--output", help="write results to .csv or .json")
+    args = parser.parse_args()
+
+    rows = sweep(args.strategies, args.block_dists, args.mixes, args.reps,
+                 args.blocks, args.procs, args.seed, args.workers)
+
+    print(f"{'strategy':<20}{'blocks':<11}{'mix':<8}{'rep':>4}{'fail%':>8}{'internal':>10}{'external':>10}{'us/op':>9}")
+    for r in rows:
+        print(f"{r['strategy']:<20}{r['block_dist']:<11}{r['mix']:<8}{r['rep']:>4}{r['failure_rate'] * 100:>8.1f}"
+              f"{r['internal_frag']:>10}{r['external_frag']:>10}{r['us_per_op']:>9.2f}")
+    if args.output:
+        write_results(rows, args.output)
+        print(f"Saved {len(rows)} rows to {args.output}")
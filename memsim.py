@@ -0,0 +1,244 @@
+# -------------------------------------------
+# Dynamic contiguous-memory simulator:
+# allocate(size) / free(handle) with coalescing of holes,
+# using First Fit, Best Fit, Worst Fit or Next Fit placement
+# -------------------------------------------
+import random
+from bisect import bisect_left, insort
+
+
+# -------------------------------------------
+# Free-list indexes
+# -------------------------------------------
+class _Node:
+    __slots__ = ("start", "size", "prio", "left", "right", "max_size")
+
+    def __init__(self, start, size, prio):
+        self.start = start
+        self.size = size
+        self.prio = prio
+        self.left = None
+        self.right = None
+        self.max_size = size
+
+
+def _fix(t):
+    m = t.size
+    if t.left is not None and t.left.max_size > m:
+        m = t.left.max_size
+    if t.right is not None and t.right.max_size > m:
+        m = t.right.max_size
+    t.max_size = m
+
+
+def _split(t, key):
+    """Split treap t into (starts < key, starts >= key)."""
+    if t is None:
+        return None, None
+    if t.start < key:
+        left, right = _split(t.right, key)
+        t.right = left
+        _fix(t)
+        return t, right
+    left, right = _split(t.left, key)
+    t.left = right
+    _fix(t)
+    return left, t
+
+
+def _merge(a, b):
+    """Merge treaps a and b where every start in a < every start in b."""
+    if a is None:
+        return b
+    if b is None:
+        return a
+    if a.prio > b.prio:
+        a.right = _merge(a.right, b)
+        _fix(a)
+        return a
+    b.left = _merge(a, b.left)
+    _fix(b)
+    return b
+
+
+class HoleTree:
+    """
+    Holes ordered by address in a treap, each subtree keeping its largest hole.
+    Insert, remove and "lowest-address hole at or after addr with size >= p"
+    are all O(log H) expected.
+    """
+
+    def __init__(self, seed=0):
+        self.root = None
+        self.rng = random.Random(seed)
+
+    def insert(self, start, size):
+        left, right = _split(self.root, start)
+        self.root = _merge(_merge(left, _Node(start, size, self.rng.random())), right)
+
+    def remove(self, start):
+        left, right = _split(self.root, start)
+        _, right = _split(right, start + 1)
+        self.root = _merge(left, right)
+
+    def find_first(self, p, from_addr=0):
+        """Start of the lowest-address hole with start >= from_addr and size >= p, or -1."""
+        return self._find(self.root, p, from_addr)
+
+    def _find(self, t, p, from_addr):
+        if t is None or t.max_size < p:
+            return -1
+        if t.start >= from_addr:
+            found = self._find(t.left, p, from_addr)
+            if found != -1:
+                return found
+            if t.size >= p:
+                return t.start
+        return self._find(t.right, p, from_addr)
+
+
+# -------------------------------------------
+# Simulator
+# -------------------------------------------
+PLACEMENTS = ("first_fit", "best_fit", "worst_fit", "next_fit")
+
+
+class MemorySimulator:
+    """
+    Contiguous memory of total_size units. allocate(size) returns a handle
+    (or -1 if no hole is large enough); free(handle) returns the block and merges
+    it with the holes on either side. Requests are rounded up to a multiple of
+    granule, and the rounding is counted as internal fragmentation.
+    Holes are indexed by address (HoleTree, plus start/end dictionaries for
+    coalescing) and by size (sorted list of (size, start)). Address lookups are
+    O(log H) expected. The size index is searched with bisect in O(log H), but
+    insort/del shift the list, so updating it is O(H) (a fast memmove in practice).
+    """
+
+    def __init__(self, total_size, strategy="first_fit", granule=1):
+        if strategy not in PLACEMENTS:
+            raise ValueError(f"Unknown strategy {strategy!r}; choose from {PLACEMENTS}")
+        if granule < 1:
+            raise ValueError(f"granule must be >= 1, got {granule}")
+        self.total_size = total_size
+        self.strategy = strategy
+        self.granule = granule
+        self.holes = HoleTree()
+        self.hole_size = {}    # start -> size
+        self.hole_at_end = {}  # end address -> start
+        self.by_size = []      # sorted (size, start); O(H) insert/delete
+        self.blocks = {}       # handle -> (start, size, requested)
+        self.next_handle = 0
+        self.rover = 0         # next fit: where the last placement happened
+        self.used = 0
+        self.internal_frag = 0
+        self.allocations = 0
+        self.failures = 0
+        if total_size > 0:
+            self._add_hole(0, total_size)
+
+    def _add_hole(self, start, size):
+        self.holes.insert(start, size)
+        self.hole_size[start] = size
+        self.hole_at_end[start + size] = start
+        insort(self.by_size, (size, start))
+
+    def _remove_hole(self, start):
+        size = self.hole_size.pop(start)
+        del self.hole_at_end[start + size]
+        self.holes.remove(start)
+        del self.by_size[bisect_left(self.by_size, (size, start))]
+        return size
+
+    def _choose(self, size):
+        if self.strategy == "first_fit":
+            return self.holes.find_first(size)
+        if self.strategy == "next_fit":
+            start = self.holes.find_first(size, self.rover)
+            return start if start != -1 else self.holes.find_first(size)
+        if not self.by_size:
+            return -1
+        if self.strategy == "best_fit":
+            k = bisect_left(self.by_size, (size, -1))
+        else:   # worst fit: largest hole, lowest address on ties
+            k = bisect_left(self.by_size, (self.by_size[-1][0], -1))
+            if self.by_size[k][0] < size:
+                return -1
+        return self.by_size[k][1] if k < len(self.by_size) else -1
+
+    def allocate(self, size):
+        if size < 0:
+            raise ValueError(f"Cannot allocate a negative size ({size})")
+        requested = size
+        size = -(-size // self.granule) * self.granule
+        start = self._choose(size)
+        if start == -1:
+            self.failures += 1
+            return -1
+        hole = self._remove_hole(start)
+        if hole > size:
+            self._add_hole(start + size, hole - size)
+        handle = self.next_handle
+        self.next_handle += 1
+        self.blocks[handle] = (start, size, requested)
+        self.rover = start
+        self.used += size
+        self.internal_frag += size - requested
+        self.allocations += 1
+        return handle
+
+    def free(self, handle):
+        start, size, requested = self.blocks.pop(handle)
+        self.used -= size
+        self.internal_frag -= size - requested
+        end = start + size
+        if start in self.hole_at_end:          # merge with the hole just below
+            below = self.hole_at_end[start]
+            size += self._remove_hole(below)
+            start = below
+        if end in self.hole_size:              # merge with the hole just above
+            size += self._remove_hole(end)
+        self._add_hole(start, size)
+
+    def largest_hole(self):
+        return self.by_size[-1][0] if self.by_size else 0
+
+    def stats(self):
+        free = self.total_size - self.used
+        largest = self.largest_hole()
+        return {
+            "used": self.used,
+            "free": free,
+            "holes": len(self.hole_size),
+            "internal_frag": self.internal_frag,
+            "largest_hole": largest,
+            # share of free memory that is not in the largest hole
+            "external_frag": (free - largest) / free if free else 0.0,
+            "allocations": self.allocations,
+            "failures": self.failures,
+        }
+
+
+# -------------------------------------------
+# Main Program (Modify input here)
+# -------------------------------------------
+if __name__ == "__main__":
+
+    memory = 1000
+    ops = [("alloc", 212), ("alloc", 417), ("alloc", 112), ("free", 1),
+           ("alloc", 95), ("alloc", 300), ("free", 0), ("alloc", 426)]
+
+    for strategy in PLACEMENTS:
+        sim = MemorySimulator(memory, strategy)
+        handles = []
+        print(f"\n--- {strategy} ---")
+        for op, arg in ops:
+            if op == "alloc":
+                h = sim.allocate(arg)
+                handles.append(h)
+                where = f"at {sim.blocks[h][0]}" if h != -1 else "FAILED"
+                print(f"alloc {arg}\t-> handle {h} {where}")
+            else:
+                sim.free(handles[arg])
+                print(f"free handle {handles[arg]}")
+        print("Stats:", sim.stats())
@@ -0,0 +1,153 @@
+# -------------------------------------------
+# Streaming trace replay for the memory simulator.
+#
+# Events are read lazily from a trace file and fed through MemorySimulator;
+# the trace is never held in memory. Metrics are running totals (O(1) per
+# event) and are emitted every `interval` events.
+#
+# Trace formats:
+#   CSV    : one event per line, "a,<id>,<size>" or "f,<id>"
+#   binary : fixed 9-byte records, struct "<BII" = (op, id, size),
+#            op 0 = alloc, 1 = free (size is ignored for frees)
+#
+# Run:  python memtrace.py trace.csv --memory 1048576 --strategy best_fit --interval 10000
+# -------------------------------------------
+import argparse
+import csv
+import json
+import struct
+import sys
+
+from memsim import PLACEMENTS, MemorySimulator
+
+RECORD = struct.Struct("<BII")
+ALLOC, FREE = 0, 1
+
+
+def read_csv_events(path):
+    with open(path, newline="") as f:
+        for row in csv.reader(f):
+            if not row or row[0].startswith("#"):
+                continue
+            if row[0] == "a":
+                size = int(row[2])
+                if size < 0:
+                    raise ValueError(f"Bad trace line: {row}")
+                yield ALLOC, int(row[1]), size
+            elif row[0] == "f":
+                yield FREE, int(row[1]), 0
+            else:
+                raise ValueError(f"Bad trace line: {row}")
+
+
+def read_binary_events(path, chunk_records=65536):
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(RECORD.size * chunk_records)
+            if not chunk:
+                break
+            if len(chunk) % RECORD.size:
+                raise ValueError("Truncated binary trace record.")
+            yield from RECORD.iter_unpack(chunk)
+
+
+def read_events(path):
+    """Pick the reader from the file extension (.bin = binary, otherwise CSV)."""
+    return read_binary_events(path) if path.endswith(".bin") else read_csv_events(path)
+
+
+def write_binary_trace(events, path):
+    """Write (op, id, size) events to the compact binary format; returns the count."""
+    count = 0
+    with open(path, "wb") as f:
+        for op, tid, size in events:
+            f.write(RECORD.pack(op, tid, size))
+            count += 1
+    return count
+
+
+def replay(events, sim, interval=10000):
+    """
+    Feed events through sim and yield a metrics dict every `interval` events
+    and once at the end. Frees of unknown or failed ids count as bad_frees;
+    allocations that reuse an id that is still live count as bad_allocs and are
+    skipped, so the live block keeps its id and can still be freed.
+    """
+    handles = {}   # trace id -> simulator handle
+    count = 0
+    bad_frees = 0
+    bad_allocs = 0
+    peak_used = 0
+    for op, tid, size in events:
+        count += 1
+        if op == ALLOC:
+            if tid in handles:
+                bad_allocs += 1
+            else:
+                h = sim.allocate(size)
+                if h != -1:
+                    handles[tid] = h
+                    if sim.used > peak_used:
+                        peak_used = sim.used
+        else:
+            h = handles.pop(tid, None)
+            if h is None:
+                bad_frees += 1
+            else:
+                sim.free(h)
+        if count % interval == 0:
+            yield _metrics(sim, count, bad_frees, bad_allocs, peak_used)
+    if count % interval:
+        yield _metrics(sim, count, bad_frees, bad_allocs, peak_used)
+
+
+def _metrics(sim, count, bad_frees, bad_allocs, peak_used):
+    free = sim.total_size - sim.used
+    largest = sim.largest_hole()
+    return {
+        "events": count,
+        "live": len(sim.blocks),
+        "used": sim.used,
+        "peak_used": peak_used,
+        "internal_frag": sim.internal_frag,
+        "external_frag_units": free - largest,   # free units outside the largest hole (stats() gives the ratio)
+        "largest_hole": largest,
+        "holes": len(sim.hole_size),
+        "failures": sim.failures,
+        "bad_frees": bad_frees,
+        "bad_allocs": bad_allocs,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay an alloc/free trace through the memory simulator")
+    parser.add_argument("trace", help="CSV trace, or .bin binary trace")
+    parser.add_argument("--memory", type=int, required=True, help="total memory size")
+    parser.add_argument("--strategy", choices=PLACEMENTS, default="first_fit")
+    parser.add_argument("--granule", type=int, default=1, help="allocation rounding unit")
+    parser.add_argument("--interval", type=int, default=10000, help="events between metric lines")
+    parser.add_argument("--format", choices=["csv", "jsonl"], default="csv", help="metrics output format")
+    parser.add_argument("--to-binary", metavar="PATH", help="convert the trace to binary format and exit")
+    args = parser.parse_args()
+    if args.interval < 1:
+        parser.error("--interval must be >= 1")
+
+    if args.to_binary:
+        n = write_binary_trace(read_events(args.trace), args.to_binary)
+        print(f"Wrote {n} events to {args.to_binary}")
+        return
+
+    sim = MemorySimulator(args.memory, args.strategy, args.granule)
+    writer = None
+    for m in replay(read_events(args.trace), sim, args.interval):
+        if args.format == "jsonl":
+            print(json.dumps(m))
+        else:
+            if writer is None:
+                writer = csv.DictWriter(sys.stdout, fieldnames=list(m))
+                writer.writeheader()
+            writer.writerow(m)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+# -----------------------------------------------------------
+# Quantum sweep for Round Robin style schedulers.
+#
+# One workload is loaded once per worker process; every
+# (variant, quantum) cell runs in a process pool and only its
+# summary row comes back. TAT/WT/response-time percentiles and
+# context-switch counts are computed with NumPy when it is
+# installed (pure Python otherwise, same numbers).
+#
+# Variants:
+#   rr           - round_robin_event
+#   mlfq         - MLFQ with periodic priority boost (aging)
+#   mlfq-noboost - MLFQ without the boost
+#
+# Run:  python rr_sweep.py workload.csv --range 1 33 1 --workers 8 --output sweep.csv
+# -----------------------------------------------------------
+import argparse
+from time import perf_counter
+
+from sheduling import Timeline, mlfq, percentile, read_workload, round_robin_event
+from sweep_common import run_grid, write_results
+
+try:
+    import numpy as np
+except ImportError:  # optional: pure-Python metrics are used without it
+    np = None
+
+VARIANTS = {
+    "rr": lambda p, at, bt, q: round_robin_event(p, at, bt, q, Timeline()),
+    "mlfq": lambda p, at, bt, q: mlfq(p, at, bt, q, timeline=Timeline()),
+    "mlfq-noboost": lambda p, at, bt, q: mlfq(p, at, bt, q, boost=0, timeline=Timeline()),
+}
+
+PERCENTILES = (50, 90, 99)
+
+_workload = None   # (processes, at, bt) loaded once per worker
+
+
+def _load(path):
+    global _workload
+    processes, at, bt, _ = read_workload(path)
+    _workload = (processes, at, bt)
+
+
+def schedule_metrics(processes, at, bt, ct, timeline):
+    """
+    Summary row for one schedule: mean and percentile TAT, WT and response time
+    (first dispatch - arrival), context switches (adjacent slices of different
+    processes), makespan and throughput. Percentiles use the same rule as
+    sheduling.percentile.
+    """
+    if np is not None:
+        return _metrics_np(processes, at, bt, ct, timeline)
+    return _metrics_py(processes, at, bt, ct, timeline)
+
+
+def _metrics_np(processes, at, bt, ct, timeline):
+    n = len(ct)
+    at = np.asarray(at, dtype=np.int64)
+    ct = np.asarray(ct, dtype=np.int64)
+    tat = ct - at
+    wt = tat - np.asarray(bt, dtype=np.int64)
+
+    pid = np.frombuffer(timeline.pid, dtype=np.int64)
+    start = np.frombuffer(timeline.start, dtype=np.int64)
+    switches = int(np.count_nonzero(pid[1:] != pid[:-1]))
+    # slices are in time order, so a pid's first occurrence is its first dispatch
+    pids, first = np.unique(pid, return_index=True)
+    proc = np.asarray(processes, dtype=np.int64)
+    by_pid = np.argsort(proc, kind="stable")
+    idx = by_pid[np.searchsorted(proc[by_pid], pids)]
+    response = start[first] - at[idx]
+
+    row = {"n": n}
+    for name, values in (("tat", tat), ("wt", wt), ("response", response)):
+        values = np.sort(values)
+        k = len(values)
+        row[f"mean_{name}"] = float(values.mean()) if k else 0.0
+        for q in PERCENTILES:
+            row[f"p{q}_{name}"] = int(values[min(k - 1, int(q / 100 * k))]) if k else 0
+    makespan = int(ct.max() - at.min()) if n else 0
+    return _finish(row, n, switches, makespan)
+
+
+def _metrics_py(processes, at, bt, ct, timeline):
+    n = len(ct)
+    tat = [ct[i] - at[i] for i in range(n)]
+    wt = [tat[i] - bt[i] for i in range(n)]
+
+    index = {p: i for i, p in enumerate(processes)}
+    first = {}
+    switches = 0
+    prev = None
+    for p, s, _ in timeline:
+        if prev is not None and p != prev:
+            switches += 1
+        prev = p
+        if p not in first:
+            first[p] = s
+    response = [s - at[index[p]] for p, s in first.items()]
+
+    row = {"n": n}
+    for name, values in (("tat", tat), ("wt", wt), ("response", response)):
+        values = sorted(values)
+        row[f"mean_{name}"] = sum(values) / len(values) if values else 0.0
+        for q in PERCENTILES:
+            row[f"p{q}_{name}"] = percentile(values, q)
+    makespan = max(ct) - min(at) if n else 0
+    return _finish(row, n, switches, makespan)
+
+
+def _finish(row, n, switches, makespan):
+    row["context_switches"] = switches
+    row["switches_per_process"] = switches / n if n else 0.0
+    row["makespan"] = makespan
+    row["throughput"] = n / makespan if makespan else 0.0
+    return row
+
+
+def run_one(task):
+    """
+    Run one (variant, quantum) cell on the worker's workload. switch_overhead
+    is the share of CPU time that context switches would take if each one
+    cost switch_cost time units.
+    """
+    variant, quantum, switch_cost = task
+    processes, at, bt = _workload
+    start = perf_counter()
+    ct, _, _, timeline = VARIANTS[variant](processes, at, bt, quantum)
+    elapsed = perf_counter() - start
+    row = schedule_metrics(processes, at, bt, ct, timeline)
+    overhead = row["context_switches"] * switch_cost
+    busy = sum(bt) + overhead
+    row["switch_overhead"] = overhead / busy if busy else 0.0
+    return {"variant": variant, "quantum": quantum, **row, "seconds": elapsed}
+
+
+def sweep(path, variants, quanta, switch_cost=0, workers=None):
+    """Run every (variant, quantum) pair; rows come back in grid order regardless of workers."""
+    tasks = [(v, q, switch_cost) for v in variants for q in quanta]
+    return run_grid(run_one, tasks, workers, initializer=_load, initargs=(path,))
+
+
+# -----------------------------------------------------------
+# Main Program
+# -----------------------------------------------------------
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Sweep the time quantum of Round Robin style schedulers")
+    parser.add_argument("workload", help="CSV or JSONL workload (at, bt, priority)")
+    parser.add_argument("--variants", nargs="+", default=["rr"], choices=list(VARIANTS))
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument("--quanta", type=int, nargs="+", help="quanta to try")
+    group.add_argument("--range", type=int, nargs=3, metavar=("START", "STOP", "STEP"),
+                       help="quanta from range(START, STOP, STEP)")
+    parser.add_argument("--switch-cost", type=float, default=0, help="time units charged per context switch")
+    parser.add_argument("--workers", type=int, default=None, help="process pool size (1 = run serially)")
+    parser.add_argument("--output", help="write results to .csv or .json")
+    args = parser.parse_args()
+
+    quanta = args.quanta or (list(range(*args.range)) if args.range else [1, 2, 4, 8, 16, 32])
+    if not quanta or min(quanta) < 1:
+        parser.error("need at least one quantum, all >= 1")
+    rows = sweep(args.workload, args.variants, quanta, args.switch_cost, args.workers)
+
+    print(f"{'variant':<14}{'q':>5}{'mean TAT':>10}{'p99 TAT':>9}{'mean WT':>10}{'p99 resp':>10}"
+          f"{'switches':>10}{'overhead%':>10}{'thrpt':>9}")
+    for r in rows:
+        print(f"{r['variant']:<14}{r['quantum']:>5}{r['mean_tat']:>10.2f}{r['p99_tat']:>9}{r['mean_wt']:>10.2f}"
+              f"{r['p99_response']:>10}{r['context_switches']:>10}{r['switch_overhead'] * 100:>10.2f}"
+              f"{r['throughput']:>9.4f}")
+    if args.output:
+        write_results(rows, args.output)
+        print(f"Saved {len(rows)} rows to {args.output}")
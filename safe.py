@@ -30,38 +30,39 @@ def is_safe(processes, available, max_need, allocation):
     return True, safe_seq
 
 
-# ------------------------------
-# Example Input
-# ------------------------------
-processes = [0, 1, 2, 3, 4]
+if __name__ == "__main__":
+    # ------------------------------
+    # Example Input
+    # ------------------------------
+    processes = [0, 1, 2, 3, 4]
 
-allocation = [
-    [0, 1, 0],  
-    [2, 0, 0],  
-    [3, 0, 2],  
-    [2, 1, 1],  
-    [0, 0, 2]
-]
+    allocation = [
+        [0, 1, 0],  
+        [2, 0, 0],  
+        [3, 0, 2],  
+        [2, 1, 1],  
+        [0, 0, 2]
+    ]
 
-max_need = [
-    [7, 5, 3],  
-    [3, 2, 2],  
-    [9, 0, 2],  
-    [2, 2, 2],  
-    [4, 3, 3]
-]
+    max_need = [
+        [7, 5, 3],  
+        [3, 2, 2],  
+        [9, 0, 2],  
+        [2, 2, 2],  
+        [4, 3, 3]
+    ]
 
-available = [3, 3, 2]
+    available = [3, 3, 2]
 
 
-# ------------------------------
-# Run Safety Check
-# ------------------------------
-safe, seq = is_safe(processes, available, max_need, allocation)
+    # ------------------------------
+    # Run Safety Check
+    # ------------------------------
+    safe, seq = is_safe(processes, available, max_need, allocation)
 
-print("\n--- BANKER'S ALGORITHM RESULT ---")
-if safe:
-    print("System is in a SAFE state.")
-    print("Safe sequence:", seq)
-else:
-    print("System is NOT in a safe state (Deadlock Possible).")
+    print("\n--- BANKER'S ALGORITHM RESULT ---")
+    if safe:
+        print("System is in a SAFE state.")
+        print("Safe sequence:", seq)
+    else:
+        print("System is NOT in a safe state (Deadlock Possible).")
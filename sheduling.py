@@ -1,7 +1,18 @@
 # -----------------------------------------------------------
-# CPU Scheduling: FCFS, SJF, SRTN, Priority, Round Robin
+# CPU Scheduling: FCFS, SJF, SRTN, Priority, Round Robin,
+# MLFQ, CFS
 # Menu-driven program with manual input
+# (run with a workload file for batch mode:
+#  python sheduling.py workload.csv --algorithms sjf rr --quantum 4)
 # -----------------------------------------------------------
+import argparse
+import csv
+import heapq
+import json
+import sys
+from array import array
+from collections import deque
+from time import perf_counter
 
 def calculate_metrics(processes, bt, ct, at):
     tat = [0] * len(processes)
@@ -12,21 +23,79 @@ def calculate_metrics(processes, bt, ct, at):
     return tat, wt
 
 
+# -----------------------------------------------------------
+# Gantt timeline
+# Parallel array columns of (pid, start, end); a slice that
+# continues the previous one is merged into it. Strings are
+# only built by render(). With a sink, full chunks are written
+# out as "pid,start,end" lines and dropped from memory.
+# -----------------------------------------------------------
+class Timeline:
+    def __init__(self, sink=None, chunk=65536):
+        # 'q' (64-bit) rather than 'i' so microsecond timestamps do not overflow
+        self.pid = array("q")
+        self.start = array("q")
+        self.end = array("q")
+        self.sink = sink
+        self.chunk = chunk
+        self.flushed = 0   # slices already written to sink
+
+    def add(self, pid, start, end):
+        if self.pid and self.pid[-1] == pid and self.end[-1] == start:
+            self.end[-1] = end
+            return
+        if self.sink is not None and len(self.pid) >= self.chunk:
+            self.flush(keep_last=True)
+        self.pid.append(pid)
+        self.start.append(start)
+        self.end.append(end)
+
+    def flush(self, keep_last=False):
+        """Write buffered slices to the sink (the last one stays if it may still grow)."""
+        if self.sink is None:
+            return
+        k = len(self.pid) - 1 if keep_last else len(self.pid)
+        if k <= 0:
+            return
+        self.sink.write("".join(f"{self.pid[j]},{self.start[j]},{self.end[j]}\n" for j in range(k)))
+        self.flushed += k
+        del self.pid[:k], self.start[:k], self.end[:k]
+
+    def __len__(self):
+        return self.flushed + len(self.pid)
+
+    def __iter__(self):
+        return zip(self.pid, self.start, self.end)
+
+    def __eq__(self, other):
+        if not isinstance(other, Timeline):
+            return NotImplemented
+        return (self.pid, self.start, self.end) == (other.pid, other.start, other.end)
+
+    def render(self):
+        return [f"P{p}[{s}-{e}]" for p, s, e in self]
+
+    def write_csv(self, f):
+        f.write("pid,start,end\n")
+        for p, s, e in self:
+            f.write(f"{p},{s},{e}\n")
+
+
 # -----------------------------------------------------------
 # 1. FCFS
 # -----------------------------------------------------------
-def fcfs(processes, at, bt):
+def fcfs(processes, at, bt, timeline=None):
     n = len(processes)
     ct = [0]*n
-    gantt = []
+    gantt = timeline if timeline is not None else Timeline()
 
     time = 0
     for i in range(n):
         if time < at[i]:
             time = at[i]
+        gantt.add(processes[i], time, time + bt[i])
         time += bt[i]
         ct[i] = time
-        gantt.append(f"P{processes[i]}({ct[i]})")
 
     tat, wt = calculate_metrics(processes, bt, ct, at)
     return ct, tat, wt, gantt
@@ -41,7 +110,7 @@ def sjf(processes, at, bt):
     ct = [0]*n
     time = 0
     completed = 0
-    gantt = []
+    gantt = Timeline()
 
     while completed != n:
         idx = -1
@@ -56,11 +125,11 @@ def sjf(processes, at, bt):
             time += 1
             continue
 
+        gantt.add(processes[idx], time, time + bt[idx])
         time += bt[idx]
         ct[idx] = time
         done[idx] = True
         completed += 1
-        gantt.append(f"P{processes[idx]}({ct[idx]})")
 
     tat, wt = calculate_metrics(processes, bt, ct, at)
     return ct, tat, wt, gantt
@@ -75,8 +144,7 @@ def srtn(processes, at, bt):
     ct = [0]*n
     time = 0
     completed = 0
-    gantt = []
-    prev = -1
+    gantt = Timeline()
 
     while completed != n:
         idx = -1
@@ -91,9 +159,7 @@ def srtn(processes, at, bt):
             continue
 
         rt[idx] -= 1
-        if prev != idx:
-            gantt.append(f"P{processes[idx]}->")
-            prev = idx
+        gantt.add(processes[idx], time, time + 1)
 
         if rt[idx] == 0:
             ct[idx] = time + 1
@@ -114,7 +180,7 @@ def priority_scheduling(processes, at, bt, priority):
     ct = [0]*n
     time = 0
     completed = 0
-    gantt = []
+    gantt = Timeline()
 
     while completed != n:
         idx = -1
@@ -129,11 +195,11 @@ def priority_scheduling(processes, at, bt, priority):
             time += 1
             continue
 
+        gantt.add(processes[idx], time, time + bt[idx])
         time += bt[idx]
         ct[idx] = time
         done[idx] = True
         completed += 1
-        gantt.append(f"P{processes[idx]}({ct[idx]})")
 
     tat, wt = calculate_metrics(processes, bt, ct, at)
     return ct, tat, wt, gantt
@@ -148,7 +214,7 @@ def round_robin(processes, at, bt, quantum):
     ct = [0]*n
     time = 0
     ready = []
-    gantt = []
+    gantt = Timeline()
 
     while True:
         for i in range(n):
@@ -162,14 +228,14 @@ def round_robin(processes, at, bt, quantum):
         idx = ready.pop(0)
 
         if rt[idx] > quantum:
+            gantt.add(processes[idx], time, time + quantum)
             time += quantum
             rt[idx] -= quantum
-            gantt.append(f"P{processes[idx]}->")
         else:
+            gantt.add(processes[idx], time, time + rt[idx])
             time += rt[idx]
             rt[idx] = 0
             ct[idx] = time
-            gantt.append(f"P{processes[idx]}({ct[idx]})")
 
         for i in range(n):
             if at[i] <= time and rt[i] > 0 and i not in ready:
@@ -182,63 +248,492 @@ def round_robin(processes, at, bt, quantum):
     return ct, tat, wt, gantt
 
 
+# -----------------------------------------------------------
+# Event-driven core
+# Arrivals are sorted once, the clock jumps straight to the next
+# arrival instead of ticking through idle time, and the ready set
+# is a heap keyed by the policy. Same CT/TAT/WT/Gantt as above.
+# -----------------------------------------------------------
+def event_schedule(processes, at, bt, key, timeline=None):
+    """
+    Non-preemptive scheduling; key(i) orders the ready heap (smallest runs first).
+    Pass a Timeline (e.g. one streaming to a file) to record the Gantt chart into it.
+    """
+    n = len(processes)
+    order = sorted(range(n), key=lambda i: (at[i], i))
+    ct = [0]*n
+    ready = []
+    gantt = timeline if timeline is not None else Timeline()
+    time = 0
+    nxt = 0   # cursor into order: next process to arrive
+
+    for _ in range(n):
+        if not ready and at[order[nxt]] > time:
+            time = at[order[nxt]]   # idle: jump to the next arrival
+        while nxt < n and at[order[nxt]] <= time:
+            i = order[nxt]
+            heapq.heappush(ready, (key(i), i))
+            nxt += 1
+
+        _, idx = heapq.heappop(ready)
+        gantt.add(processes[idx], time, time + bt[idx])
+        time += bt[idx]
+        ct[idx] = time
+
+    tat, wt = calculate_metrics(processes, bt, ct, at)
+    return ct, tat, wt, gantt
+
+
+def sjf_event(processes, at, bt, timeline=None):
+    return event_schedule(processes, at, bt, lambda i: (bt[i], i), timeline)
+
+
+def priority_scheduling_event(processes, at, bt, priority, timeline=None):
+    return event_schedule(processes, at, bt, lambda i: (priority[i], i), timeline)
+
+
+def srtn_event(processes, at, bt, timeline=None):
+    """
+    SRTN that only reconsiders its choice at arrivals and completions.
+    Waiting processes sit in a min-heap on (remaining time, index), so the
+    cost is O(n log n) however long the bursts are.
+    """
+    n = len(processes)
+    order = sorted(range(n), key=lambda i: (at[i], i))
+    rt = bt.copy()
+    ct = [0]*n
+    ready = []
+    gantt = timeline if timeline is not None else Timeline()
+    time = 0
+    nxt = 0
+    cur = -1
+    completed = 0
+
+    while completed != n:
+        if cur == -1 and not ready and at[order[nxt]] > time:
+            time = at[order[nxt]]
+        while nxt < n and at[order[nxt]] <= time:
+            i = order[nxt]
+            heapq.heappush(ready, (rt[i], i))
+            nxt += 1
+
+        if cur == -1:
+            _, cur = heapq.heappop(ready)
+        elif ready and ready[0] < (rt[cur], cur):
+            cur = heapq.heappushpop(ready, (rt[cur], cur))[1]   # preempt
+
+        # run until the next arrival or until cur completes, whichever is first
+        run = rt[cur]
+        if nxt < n and at[order[nxt]] - time < run:
+            run = at[order[nxt]] - time
+        gantt.add(processes[cur], time, time + run)
+        time += run
+        rt[cur] -= run
+        if rt[cur] == 0:
+            ct[cur] = time
+            completed += 1
+            cur = -1
+
+    tat, wt = calculate_metrics(processes, bt, ct, at)
+    return ct, tat, wt, gantt
+
+
+def round_robin_event(processes, at, bt, quantum, timeline=None):
+    """
+    Round Robin on a deque with a cursor over the pre-sorted arrivals and a
+    count of unfinished processes, so each dispatch is O(1) amortized (plus
+    sorting each batch of arrivals by index). As in round_robin, the processes
+    that arrived during a quantum and the preempted one are appended together
+    in index order.
+    """
+    n = len(processes)
+    order = sorted(range(n), key=lambda i: (at[i], i))
+    rt = bt.copy()
+    ct = [0]*n
+    ready = deque()
+    gantt = timeline if timeline is not None else Timeline()
+    time = 0
+    nxt = 0
+    remaining = sum(1 for b in bt if b > 0)
+
+    def admit(requeue=-1):
+        nonlocal nxt
+        batch = []
+        while nxt < n and at[order[nxt]] <= time:
+            if rt[order[nxt]] > 0:
+                batch.append(order[nxt])
+            nxt += 1
+        if requeue != -1:
+            batch.append(requeue)
+        batch.sort()
+        ready.extend(batch)
+
+    while remaining:
+        admit()
+        if not ready:
+            time = at[order[nxt]]   # idle: jump to the next arrival
+            continue
+
+        idx = ready.popleft()
+
+        if rt[idx] > quantum:
+            gantt.add(processes[idx], time, time + quantum)
+            time += quantum
+            rt[idx] -= quantum
+            admit(idx)
+        else:
+            gantt.add(processes[idx], time, time + rt[idx])
+            time += rt[idx]
+            rt[idx] = 0
+            ct[idx] = time
+            remaining -= 1
+            admit()
+
+    tat, wt = calculate_metrics(processes, bt, ct, at)
+    return ct, tat, wt, gantt
+
+
+# -----------------------------------------------------------
+# 6. MLFQ (Multilevel Feedback Queue)
+# -----------------------------------------------------------
+def mlfq(processes, at, bt, quantum=2, levels=3, boost=100, timeline=None):
+    """
+    Level k is a FIFO queue with quantum * 2**k. A process that uses up its
+    quantum moves down one level; every `boost` time units all processes go
+    back to the top level so nothing starves. A new arrival (top level)
+    preempts a process running on a lower level, which keeps its place at the
+    front of its level. Each level is a deque of deque segments, so a boost
+    splices the lower levels onto the top one in O(levels) instead of moving
+    every process; the used allotment is reset lazily via an epoch stamp.
+    """
+    n = len(processes)
+    order = sorted(range(n), key=lambda i: (at[i], i))
+    rt = bt.copy()
+    ct = [0]*n
+    used = [0]*n    # time used at the current level
+    epoch = [0]*n   # boost count when used[] was last valid
+    boosts = 0
+    quanta = [quantum * 2**k for k in range(levels)]
+    queues = [deque([deque()]) for _ in range(levels)]
+    sizes = [0]*levels
+    gantt = timeline if timeline is not None else Timeline()
+    time = 0
+    nxt = 0
+    remaining = n
+    next_boost = boost if boost > 0 else float("inf")
+
+    while remaining:
+        while nxt < n and at[order[nxt]] <= time:
+            i = order[nxt]
+            nxt += 1
+            if rt[i] == 0:
+                ct[i] = at[i]
+                remaining -= 1
+            else:
+                queues[0][-1].append(i)
+                sizes[0] += 1
+        if time >= next_boost:
+            boosts += 1
+            for k in range(1, levels):
+                if sizes[k]:
+                    queues[0].extend(queues[k])
+                    queues[0].append(deque())
+                    queues[k] = deque([deque()])
+                    sizes[0] += sizes[k]
+                    sizes[k] = 0
+            next_boost += ((time - next_boost) // boost + 1) * boost   # skip boosts missed while idle
+
+        k = 0
+        while k < levels and not sizes[k]:
+            k += 1
+        if k == levels:
+            if nxt < n:
+                time = at[order[nxt]]   # idle: jump to the next arrival
+            continue
+
+        segments = queues[k]
+        while not segments[0]:
+            segments.popleft()
+        idx = segments[0].popleft()
+        sizes[k] -= 1
+        if epoch[idx] != boosts:
+            epoch[idx] = boosts
+            used[idx] = 0
+        run = min(rt[idx], quanta[k] - used[idx], next_boost - time)
+        if k > 0 and nxt < n:
+            run = min(run, at[order[nxt]] - time)
+        gantt.add(processes[idx], time, time + run)
+        time += run
+        rt[idx] -= run
+        used[idx] += run
+
+        if rt[idx] == 0:
+            ct[idx] = time
+            remaining -= 1
+            continue
+        if used[idx] >= quanta[k]:
+            used[idx] = 0
+            if k + 1 < levels:
+                k += 1
+            queues[k][-1].append(idx)
+        else:
+            queues[k][0].appendleft(idx)   # interrupted by an arrival or a boost
+        sizes[k] += 1
+
+    tat, wt = calculate_metrics(processes, bt, ct, at)
+    return ct, tat, wt, gantt
+
+
+# -----------------------------------------------------------
+# 7. CFS-style fair scheduling
+# -----------------------------------------------------------
+def cfs(processes, at, bt, priority, latency=20, min_granularity=2, timeline=None):
+    """
+    Runs the process with the smallest virtual runtime, taken from a heap of
+    (vruntime, index). Weights follow priority (smaller = higher, each step is
+    1.25x), and vruntime grows more slowly for heavier processes. A slice is
+    latency * weight / total runnable weight, but at least min_granularity.
+    New arrivals start at the current minimum vruntime and are considered as
+    soon as they arrive. Pick and reinsert are O(log n).
+    """
+    n = len(processes)
+    order = sorted(range(n), key=lambda i: (at[i], i))
+    rt = bt.copy()
+    ct = [0]*n
+    weight = [1024 / 1.25 ** p for p in priority]
+    vruntime = [0.0]*n
+    ready = []
+    gantt = timeline if timeline is not None else Timeline()
+    total_weight = 0
+    min_vruntime = 0.0
+    time = 0
+    nxt = 0
+    remaining = n
+
+    while remaining:
+        while nxt < n and at[order[nxt]] <= time:
+            i = order[nxt]
+            nxt += 1
+            if rt[i] == 0:
+                ct[i] = at[i]
+                remaining -= 1
+                continue
+            vruntime[i] = min_vruntime
+            heapq.heappush(ready, (vruntime[i], i))
+            total_weight += weight[i]
+        if not ready:
+            if nxt < n:
+                time = at[order[nxt]]
+            continue
+
+        _, idx = heapq.heappop(ready)
+        if ready:
+            run = min(rt[idx], max(min_granularity, int(latency * weight[idx] / total_weight)))
+        else:
+            run = rt[idx]   # alone on the CPU: run until done or the next arrival
+        if nxt < n:
+            run = min(run, at[order[nxt]] - time)
+        gantt.add(processes[idx], time, time + run)
+        time += run
+        rt[idx] -= run
+        vruntime[idx] += run * 1024 / weight[idx]
+
+        if rt[idx] == 0:
+            ct[idx] = time
+            remaining -= 1
+            total_weight -= weight[idx]
+        else:
+            heapq.heappush(ready, (vruntime[idx], idx))
+        if ready:
+            min_vruntime = max(min_vruntime, ready[0][0])
+
+    tat, wt = calculate_metrics(processes, bt, ct, at)
+    return ct, tat, wt, gantt
+
+
+# -----------------------------------------------------------
+# BATCH MODE (workload files, many processes)
+# -----------------------------------------------------------
+ALGORITHMS = {
+    "fcfs": lambda p, at, bt, pr, q, tl: fcfs(p, at, bt, tl),
+    "sjf": lambda p, at, bt, pr, q, tl: sjf_event(p, at, bt, tl),
+    "srtn": lambda p, at, bt, pr, q, tl: srtn_event(p, at, bt, tl),
+    "priority": lambda p, at, bt, pr, q, tl: priority_scheduling_event(p, at, bt, pr, tl),
+    "rr": lambda p, at, bt, pr, q, tl: round_robin_event(p, at, bt, q, tl),
+    "mlfq": lambda p, at, bt, pr, q, tl: mlfq(p, at, bt, q, timeline=tl),
+    "cfs": lambda p, at, bt, pr, q, tl: cfs(p, at, bt, pr, timeline=tl),
+}
+
+
+def read_workload(path, with_cpu=False):
+    """
+    Stream a workload from CSV (header with at, bt and optionally priority, pid)
+    or JSONL (one {"at": .., "bt": .., "priority": ..} object per line).
+    Returns (processes, at, bt, priority) as flat lists; with_cpu adds a fifth
+    list from the optional "cpu" affinity column (-1 = any core).
+    """
+    processes, at, bt, priority, cpu = [], [], [], [], []
+    with open(path, newline="") as f:
+        if path.endswith(".jsonl"):
+            rows = (json.loads(line) for line in f if line.strip())
+        else:
+            rows = csv.DictReader(f)
+        for k, row in enumerate(rows):
+            processes.append(int(row.get("pid", k)))
+            at.append(int(row["at"]))
+            bt.append(int(row["bt"]))
+            priority.append(int(row.get("priority") or 0))
+            if with_cpu:
+                c = row.get("cpu")
+                cpu.append(-1 if c in (None, "") else int(c))
+    if with_cpu:
+        return processes, at, bt, priority, cpu
+    return processes, at, bt, priority
+
+
+def percentile(sorted_values, q):
+    if not sorted_values:
+        return 0
+    return sorted_values[min(len(sorted_values) - 1, int(q / 100 * len(sorted_values)))]
+
+
+def summarize(at, ct, tat, wt):
+    n = len(ct)
+    s_tat = sorted(tat)
+    s_wt = sorted(wt)
+    makespan = max(ct, default=0) - min(at, default=0)
+    return {
+        "n": n,
+        "mean_tat": sum(tat) / n if n else 0,
+        "mean_wt": sum(wt) / n if n else 0,
+        "p50_tat": percentile(s_tat, 50), "p90_tat": percentile(s_tat, 90),
+        "p99_tat": percentile(s_tat, 99), "max_tat": s_tat[-1] if n else 0,
+        "p50_wt": percentile(s_wt, 50), "p90_wt": percentile(s_wt, 90),
+        "p99_wt": percentile(s_wt, 99), "max_wt": s_wt[-1] if n else 0,
+        "makespan": makespan,
+        "throughput": n / makespan if makespan else 0,
+    }
+
+
+def run_batch(argv=None):
+    parser = argparse.ArgumentParser(description="CPU scheduling in batch mode")
+    parser.add_argument("workload", help="CSV or JSONL workload (at, bt, priority)")
+    parser.add_argument("--algorithms", nargs="+", default=list(ALGORITHMS), choices=list(ALGORITHMS))
+    parser.add_argument("--quantum", type=int, default=2, help="Round Robin quantum (MLFQ top-level quantum)")
+    parser.add_argument("--metrics", help="write per-process CT/TAT/WT rows to this CSV")
+    parser.add_argument("--summary", help="write summary statistics to this JSON file")
+    parser.add_argument("--gantt", metavar="PREFIX", help="stream each Gantt timeline to PREFIX.<algorithm>.csv")
+    args = parser.parse_args(argv)
+    if args.quantum < 1:
+        parser.error("--quantum must be >= 1")
+
+    processes, at, bt, priority = read_workload(args.workload)
+    summaries = {}
+    metrics_file = open(args.metrics, "w", newline="") if args.metrics else None
+    try:
+        writer = None
+        if metrics_file:
+            writer = csv.writer(metrics_file)
+            writer.writerow(["algorithm", "pid", "at", "bt", "ct", "tat", "wt"])
+        for name in args.algorithms:
+            gantt_file = open(f"{args.gantt}.{name}.csv", "w") if args.gantt else None
+            timeline = Timeline(sink=gantt_file)
+            if gantt_file:
+                gantt_file.write("pid,start,end\n")
+            start = perf_counter()
+            ct, tat, wt, timeline = ALGORITHMS[name](processes, at, bt, priority, args.quantum, timeline)
+            elapsed = perf_counter() - start
+            if gantt_file:
+                timeline.flush()
+                gantt_file.close()
+            if writer:
+                for i in range(len(processes)):
+                    writer.writerow((name, processes[i], at[i], bt[i], ct[i], tat[i], wt[i]))
+            summaries[name] = dict(summarize(at, ct, tat, wt), seconds=elapsed, slices=len(timeline))
+            s = summaries[name]
+            print(f"{name:<9} n={s['n']} mean TAT={s['mean_tat']:.2f} p99 TAT={s['p99_tat']} "
+                  f"mean WT={s['mean_wt']:.2f} p99 WT={s['p99_wt']} ({elapsed:.3f}s)")
+    finally:
+        if metrics_file:
+            metrics_file.close()
+
+    if args.summary:
+        with open(args.summary, "w") as f:
+            json.dump(summaries, f, indent=1)
+    return summaries
+
+
 # -----------------------------------------------------------
 # MAIN MENU-DRIVEN PROGRAM
 # -----------------------------------------------------------
 
-print("===== CPU Scheduling Menu =====")
-
-# Input number of processes
-n = int(input("Enter number of processes: "))
-
-processes = list(range(n))
-at = []
-bt = []
-priority = []
-
-print("\nEnter Arrival Time, Burst Time & Priority:")
-for i in range(n):
-    a = int(input(f"AT of P{i}: "))
-    b = int(input(f"BT of P{i}: "))
-    p = int(input(f"Priority of P{i} (smaller = higher): "))
-    at.append(a)
-    bt.append(b)
-    priority.append(p)
-    print()
-
-quantum = int(input("Enter Quantum for Round Robin: "))
-
-# Menu
-while True:
-    print("\nChoose Scheduling Algorithm:")
-    print("1. FCFS")
-    print("2. SJF")
-    print("3. SRTN")
-    print("4. Priority Scheduling")
-    print("5. Round Robin")
-    print("6. Exit")
-
-    ch = int(input("Enter choice: "))
-
-    if ch == 1:
-        ct, tat, wt, gantt = fcfs(processes, at, bt)
-    elif ch == 2:
-        ct, tat, wt, gantt = sjf(processes, at, bt)
-    elif ch == 3:
-        ct, tat, wt, gantt = srtn(processes, at, bt)
-    elif ch == 4:
-        ct, tat, wt, gantt = priority_scheduling(processes, at, bt, priority)
-    elif ch == 5:
-        ct, tat, wt, gantt = round_robin(processes, at, bt, quantum)
-    elif ch == 6:
-        print("Exiting...")
-        break
+def main():
+    print("===== CPU Scheduling Menu =====")
+
+    # Input number of processes
+    n = int(input("Enter number of processes: "))
+
+    processes = list(range(n))
+    at = []
+    bt = []
+    priority = []
+
+    print("\nEnter Arrival Time, Burst Time & Priority:")
+    for i in range(n):
+        a = int(input(f"AT of P{i}: "))
+        b = int(input(f"BT of P{i}: "))
+        p = int(input(f"Priority of P{i} (smaller = higher): "))
+        at.append(a)
+        bt.append(b)
+        priority.append(p)
+        print()
+
+    quantum = int(input("Enter Quantum for Round Robin / MLFQ: "))
+
+    # Menu
+    while True:
+        print("\nChoose Scheduling Algorithm:")
+        print("1. FCFS")
+        print("2. SJF")
+        print("3. SRTN")
+        print("4. Priority Scheduling")
+        print("5. Round Robin")
+        print("6. MLFQ")
+        print("7. CFS")
+        print("8. Exit")
+
+        ch = int(input("Enter choice: "))
+
+        if ch == 1:
+            ct, tat, wt, gantt = fcfs(processes, at, bt)
+        elif ch == 2:
+            ct, tat, wt, gantt = sjf_event(processes, at, bt)
+        elif ch == 3:
+            ct, tat, wt, gantt = srtn_event(processes, at, bt)
+        elif ch == 4:
+            ct, tat, wt, gantt = priority_scheduling_event(processes, at, bt, priority)
+        elif ch == 5:
+            ct, tat, wt, gantt = round_robin_event(processes, at, bt, quantum)
+        elif ch == 6:
+            ct, tat, wt, gantt = mlfq(processes, at, bt, quantum)
+        elif ch == 7:
+            ct, tat, wt, gantt = cfs(processes, at, bt, priority)
+        elif ch == 8:
+            print("Exiting...")
+            break
+        else:
+            print("Invalid Choice!")
+            continue
+
+        print("\n===== RESULT =====")
+        print("Completion Time:", ct)
+        print("Turnaround Time:", tat)
+        print("Waiting Time:", wt)
+        print("Gantt Chart:", " ".join(gantt.render()))
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        run_batch()
     else:
-        print("Invalid Choice!")
-        continue
-
-    print("\n===== RESULT =====")
-    print("Completion Time:", ct)
-    print("Turnaround Time:", tat)
-    print("Waiting Time:", wt)
-    print("Gantt Chart:", gantt)
+        main()
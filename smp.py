@@ -0,0 +1,280 @@
+# -----------------------------------------------------------
+# Multiprocessor (SMP) CPU scheduling simulator
+# Per-CPU run queues with FCFS / SJF / SRTN / Priority / RR,
+# idle and periodic work stealing, and optional affinity.
+# Event-driven: the clock jumps between arrivals, completions,
+# quantum expiries and balance ticks; nothing is simulated per tick.
+#
+# Run:  python smp.py workload.csv --cores 16 --policy srtn
+# -----------------------------------------------------------
+import argparse
+import heapq
+import json
+from time import perf_counter
+
+from sheduling import Timeline, calculate_metrics, read_workload, summarize
+
+POLICIES = ("fcfs", "sjf", "srtn", "priority", "rr")
+
+# event kinds; at equal times arrivals are handled first, then CPU events, then balancing
+ARRIVAL, CPU_DONE, BALANCE = 0, 1, 2
+
+
+class Core:
+    def __init__(self, cid):
+        self.cid = cid
+        self.pinned = []      # heap of (key, pid) for processes bound to this core
+        self.movable = []     # heap of (key, pid) that may be stolen
+        self.running = -1
+        self.run_start = 0
+        self.run_end = 0      # when the running slice's CPU_DONE is due
+        self.version = 0      # bumped on every dispatch/preempt; stale CPU_DONE events are ignored
+        self.busy = 0
+        self.dispatches = 0
+        self.migrations_in = 0
+        self.timeline = Timeline()
+
+    def queued(self):
+        return len(self.pinned) + len(self.movable)
+
+    def load(self):
+        return self.queued() + (self.running != -1)
+
+    def pop_best(self):
+        if self.pinned and (not self.movable or self.pinned[0] < self.movable[0]):
+            return heapq.heappop(self.pinned)
+        return heapq.heappop(self.movable)
+
+    def best(self):
+        tops = [h[0] for h in (self.pinned, self.movable) if h]
+        return min(tops) if tops else None
+
+
+def simulate(processes, at, bt, priority=None, cores=4, policy="fcfs", quantum=4,
+             balance_interval=0, affinity=None):
+    """
+    Simulate `cores` CPUs. Arrivals go to the allowed core with the lowest load
+    (lowest index on ties). An idle core steals the best movable process from
+    the core with the most movable work; with balance_interval > 0 queues are
+    also evened out periodically. affinity[i] >= 0 pins process i to that core.
+    Returns (ct, tat, wt, stats); stats holds per-core utilization, dispatches,
+    migrations and Gantt timelines.
+    RR uses the tie rule of sheduling.round_robin_event: the processes that
+    reach a core during a quantum and the preempted one are queued together in
+    index order, so on one core the schedules are identical.
+    """
+    if policy not in POLICIES:
+        raise ValueError(f"Unknown policy {policy!r}; choose from {POLICIES}")
+    if cores < 1:
+        raise ValueError(f"cores must be >= 1, got {cores}")
+    if quantum < 1:
+        raise ValueError(f"quantum must be >= 1, got {quantum}")
+    n = len(processes)
+    if priority is None:
+        priority = [0]*n
+    if affinity is None:
+        affinity = [-1]*n
+    bad = next((i for i in range(n) if affinity[i] >= cores), None)
+    if bad is not None:
+        raise ValueError(f"Process {processes[bad]} is pinned to CPU {affinity[bad]}, but there are only {cores} cores")
+    cpus = [Core(c) for c in range(cores)]
+    rt = list(bt)
+    ct = [0]*n
+    events = []      # (time, kind, tiebreak, payload)
+    for i in range(n):
+        heapq.heappush(events, (at[i], ARRIVAL, i, i))
+    if balance_interval > 0 and n:
+        heapq.heappush(events, (balance_interval, BALANCE, 0, None))
+    remaining = n
+    migrations = 0
+    idle = set(range(cores))
+    movable_waiting = 0   # processes sitting in some core's movable queue
+
+    def key(core, i):
+        if policy == "fcfs":
+            return (at[i], i)
+        if policy == "sjf":
+            return (bt[i], i)
+        if policy == "srtn":
+            return (rt[i], i)
+        if policy == "priority":
+            return (priority[i], i)
+        # RR: a busy core takes in new work when its slice ends, so everything
+        # queued for that moment sorts by index, behind work queued earlier
+        return (core.run_end if core.running != -1 else now, i)
+
+    def enqueue(core, i):
+        nonlocal movable_waiting
+        if affinity[i] >= 0:
+            heapq.heappush(core.pinned, (key(core, i), i))
+        else:
+            heapq.heappush(core.movable, (key(core, i), i))
+            movable_waiting += 1
+
+    def dispatch(core, now):
+        nonlocal movable_waiting
+        if core.running != -1:
+            return
+        if not core.queued():
+            steal(core)
+            if not core.queued():
+                return
+        from_movable = not core.pinned or (core.movable and core.movable[0] < core.pinned[0])
+        i = core.pop_best()[-1]
+        if from_movable:
+            movable_waiting -= 1
+        core.running = i
+        core.run_start = now
+        core.version += 1
+        core.dispatches += 1
+        idle.discard(core.cid)
+        run = rt[i] if policy != "rr" else min(rt[i], quantum)
+        core.run_end = now + run
+        heapq.heappush(events, (core.run_end, CPU_DONE, core.cid, (core.cid, core.version)))
+
+    def stop(core, now):
+        """Account for the running slice up to now; returns the pid that was running."""
+        i = core.running
+        ran = now - core.run_start
+        rt[i] -= ran
+        core.busy += ran
+        if ran:
+            core.timeline.add(processes[i], core.run_start, now)
+        core.running = -1
+        core.version += 1
+        idle.add(core.cid)
+        return i
+
+    def migrate(src, dst):
+        nonlocal migrations
+        heapq.heappush(dst.movable, heapq.heappop(src.movable))
+        dst.migrations_in += 1
+        migrations += 1
+
+    def steal(core):
+        """Idle stealing: take the best movable process of the core with the most movable work."""
+        if not movable_waiting:
+            return
+        victim = max(cpus, key=lambda c: (len(c.movable), -c.cid))
+        if victim is not core and victim.movable:
+            migrate(victim, core)
+
+    def balance():
+        """Periodic balancing: move movable work from the busiest to the least loaded core."""
+        while True:
+            lo = min(cpus, key=lambda c: (c.load(), c.cid))
+            donors = [c for c in cpus if c.movable]
+            if not donors:
+                return
+            hi = max(donors, key=lambda c: (c.load(), -c.cid))
+            if hi.load() - lo.load() <= 1:
+                return
+            migrate(hi, lo)
+
+    def wake_idle(now):
+        """Let idle cores steal while movable work is queued behind busy cores."""
+        for cid in sorted(idle):
+            if not movable_waiting:
+                return
+            dispatch(cpus[cid], now)
+
+    now = 0
+    arrived = set()   # cores that received arrivals at the current instant
+    while events and remaining:
+        now, kind, _, payload = heapq.heappop(events)
+        if kind == ARRIVAL:
+            i = payload
+            if rt[i] == 0:
+                ct[i] = now
+                remaining -= 1
+            else:
+                if affinity[i] >= 0:
+                    core = cpus[affinity[i]]
+                else:
+                    core = min(cpus, key=lambda c: (c.load(), c.cid))
+                enqueue(core, i)
+                arrived.add(core.cid)
+            if events and events[0][0] == now and events[0][1] == ARRIVAL:
+                continue   # decide once every arrival at this instant is queued
+            for cid in sorted(arrived):
+                core = cpus[cid]
+                if core.running == -1:
+                    dispatch(core, now)
+                elif policy == "srtn":
+                    r = core.running
+                    if core.best()[0] < (rt[r] - (now - core.run_start), r):
+                        stop(core, now)
+                        enqueue(core, r)
+                        dispatch(core, now)
+            arrived.clear()
+        elif kind == CPU_DONE:
+            cid, version = payload
+            core = cpus[cid]
+            if version != core.version:
+                continue   # preempted since this event was scheduled
+            i = stop(core, now)
+            if rt[i] == 0:
+                ct[i] = now
+                remaining -= 1
+            else:
+                enqueue(core, i)   # RR quantum expired
+            dispatch(core, now)
+        else:
+            balance()
+            for core in cpus:
+                dispatch(core, now)
+            if remaining:
+                heapq.heappush(events, (now + balance_interval, BALANCE, 0, None))
+        if idle and movable_waiting:
+            wake_idle(now)
+
+    tat, wt = calculate_metrics(processes, bt, ct, at)
+    makespan = max(ct, default=0) - min(at, default=0)
+    stats = {
+        "makespan": makespan,
+        "migrations": migrations,
+        "cores": [{
+            "core": c.cid,
+            "busy": c.busy,
+            "utilization": c.busy / makespan if makespan else 0.0,
+            "dispatches": c.dispatches,
+            "migrations_in": c.migrations_in,
+        } for c in cpus],
+        "timelines": [c.timeline for c in cpus],
+    }
+    return ct, tat, wt, stats
+
+
+# -----------------------------------------------------------
+# Main Program
+# -----------------------------------------------------------
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Multiprocessor CPU scheduling simulator")
+    parser.add_argument("workload", help="CSV or JSONL workload (at, bt, priority, optional cpu)")
+    parser.add_argument("--cores", type=int, default=8)
+    parser.add_argument("--policy", choices=POLICIES, default="fcfs")
+    parser.add_argument("--quantum", type=int, default=4, help="Round Robin quantum")
+    parser.add_argument("--balance-interval", type=int, default=0, help="periodic load balancing (0 = idle stealing only)")
+    parser.add_argument("--summary", help="write summary statistics to this JSON file")
+    args = parser.parse_args()
+
+    processes, at, bt, priority, cpu = read_workload(args.workload, with_cpu=True)
+    start = perf_counter()
+    try:
+        ct, tat, wt, stats = simulate(processes, at, bt, priority, args.cores, args.policy,
+                                      args.quantum, args.balance_interval, cpu)
+    except ValueError as e:
+        parser.error(str(e))
+    elapsed = perf_counter() - start
+
+    summary = dict(summarize(at, ct, tat, wt), seconds=elapsed,
+                   migrations=stats["migrations"], cores=stats["cores"])
+    print(f"{args.policy} on {args.cores} cores: n={summary['n']} mean TAT={summary['mean_tat']:.2f} "
+          f"p99 TAT={summary['p99_tat']} mean WT={summary['mean_wt']:.2f} p99 WT={summary['p99_wt']} "
+          f"migrations={stats['migrations']} ({elapsed:.3f}s)")
+    print("Core\tUtil%\tDispatches\tMigrations in")
+    for c in stats["cores"]:
+        print(f"CPU{c['core']}\t{c['utilization'] * 100:.1f}\t{c['dispatches']}\t\t{c['migrations_in']}")
+    if args.summary:
+        with open(args.summary, "w") as f:
+            json.dump(summary, f, indent=1)
@@ -0,0 +1,34 @@
+# -------------------------------------------
+# Helpers shared by the parameter sweeps (fit_sweep.py, rr_sweep.py):
+# run a grid of tasks serially or in a process pool, and save result rows.
+# -------------------------------------------
+import csv
+import json
+from concurrent.futures import ProcessPoolExecutor
+
+
+def run_grid(fn, tasks, workers=None, initializer=None, initargs=()):
+    """
+    Return [fn(t) for t in tasks], in task order. workers == 1 runs serially in
+    this process; otherwise a process pool is used, so fn must be a module-level
+    function. initializer(*initargs) runs once per worker (once here when serial).
+    """
+    if workers == 1:
+        if initializer is not None:
+            initializer(*initargs)
+        return [fn(t) for t in tasks]
+    chunksize = max(1, len(tasks) // (4 * (workers or 4)))
+    with ProcessPoolExecutor(max_workers=workers, initializer=initializer, initargs=initargs) as pool:
+        return list(pool.map(fn, tasks, chunksize=chunksize))
+
+
+def write_results(rows, path):
+    """Write result rows to path as JSON (.json) or CSV (anything else)."""
+    if path.endswith(".json"):
+        with open(path, "w") as f:
+            json.dump(rows, f, indent=1)
+        return
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)